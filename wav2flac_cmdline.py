@@ -7,17 +7,40 @@ Maintains the original folder structure in the output directory
 Supports optional local caching for network locations and slow drives for improved performance
 """
 
+import argparse
+import itertools
 import os
+import re
 import sys
+import json
 import logging
+import logging.handlers
+import multiprocessing
 import subprocess
 import shutil
 import tempfile
+import threading
+import queue
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import time
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import Iterator, List, NamedTuple, Tuple, Optional
+
+# Try to import soundfile (libsndfile/libFLAC bindings) for in-process encoding, FFmpeg is used if not available
+try:
+    import numpy as np
+    import soundfile as sf
+    HAS_SOUNDFILE = True
+except ImportError:
+    HAS_SOUNDFILE = False
+
+# Try to import tqdm for progress bars, throttled progress lines are printed if not available
+try:
+    from tqdm import tqdm
+    HAS_TQDM = True
+except ImportError:
+    HAS_TQDM = False
 
 # Application version
 APP_VERSION = "1.0.4"
@@ -25,21 +48,106 @@ APP_VERSION = "1.0.4"
 # Configuration constants
 FFMPEG_TIMEOUT_SECONDS = 300  # 5 minutes per file
 PREREQUISITE_CHECK_TIMEOUT = 10  # 10 seconds for FFmpeg version checks
+FFMPEG_STDERR_TAIL_BYTES = 4096  # Bytes of FFmpeg's stderr kept for the error message of a failed conversion
+WAV_FILENAME_PATTERN = re.compile(r'\.wav\Z', re.IGNORECASE)  # Matches .wav, .WAV, .Wav, ...
+FFMPEG_CAPS_CACHE_FILE = Path.home() / '.cache' / 'wav2flac' / 'ffmpeg_caps.json'  # Probe results, reused until the FFmpeg binary changes
 CACHE_COPY_THREADS = 8  # Maximum threads for I/O-bound cache copying
-PROGRESS_REPORT_INTERVAL = 10  # Report progress every N cached files
-PROGRESS_REPORT_INTERVAL_SMALL = 5  # Report progress every N converted files for small batches
-CONVERSION_PROGRESS_THRESHOLD = 20  # Show all progress for batches <= this size
+CACHE_COPY_BUFFER_SIZE = 4 * 1024 * 1024  # 4 MiB reads/writes when copying to cache (fewer round trips on network shares)
+CACHE_MIN_FILE_SIZE = 16 * 1024 * 1024  # Smaller files are converted straight from the input (FFmpeg reads them once anyway)
+CACHE_TRASH_SUFFIX = ".trash"  # Cache directories are renamed with this suffix and deleted in the background
+FICLONE = 0x40049409  # Linux ioctl sharing a file's data blocks with another file (reflink on Btrfs, XFS, ...)
+PROGRESS_PRINT_MIN_INTERVAL = 0.25  # Seconds between cache/conversion progress lines when tqdm is not installed
 DISK_SPACE_SAFETY_MARGIN = 1.2  # 20% extra space required for caching
 DEFAULT_COMPRESSION_LEVEL = 12  # FLAC compression (0=fast, 12=best)
+CONVERTED_MTIME_TOLERANCE = 2.0  # Seconds; FLAC files carry their WAV's mtime once converted (2s covers FAT/SMB granularity)
 
 # Fast output cache configuration
 OUTPUT_CACHE_BATCH_SIZE = 100  # Move files to final destination every N conversions
 OUTPUT_CACHE_MOVE_THREADS = 1  # Threads for batch moving files to final destination (reduced to prevent disk saturation)
 MOVE_FILES_DURING_CONVERSION = False  # If True, move every 100 files; if False, move all at end (recommended for RAID/HDD)
 
+# FFmpeg batching configuration
+FFMPEG_BATCH_SIZE = 16  # Maximum WAV files encoded by a single FFmpeg invocation (amortizes process startup)
+FFMPEG_BATCH_MAX_BYTES = 64 * 1024 * 1024  # Files at or above this size get their own FFmpeg process
+
+# In-process encoder configuration (requires the optional 'soundfile' package, version 0.12+)
+USE_NATIVE_ENCODER = False  # Encode with libsndfile instead of FFmpeg (faster for many small files, but BWF/bext fields are not copied)
+NATIVE_BLOCK_FRAMES = 1 << 16  # Frames read and encoded per block by the in-process encoder
+NATIVE_FLAC_SUBTYPES = {'PCM_U8': 'PCM_S8', 'PCM_S8': 'PCM_S8', 'PCM_16': 'PCM_16', 'PCM_24': 'PCM_24'}  # WAV subtype -> FLAC subtype
+NATIVE_COPIED_TAGS = ('title', 'copyright', 'software', 'artist', 'comment', 'date', 'album', 'license', 'tracknumber', 'genre')
+
 # Resource management configuration
-TASK_SUBMISSION_BATCH_SIZE = 1000  # Submit tasks in batches to prevent future accumulation
+# Worker process scheduling
+PIN_WORKER_CPU_AFFINITY = False  # Pin each worker (and the FFmpeg processes it starts) to its own cores - Linux only, best on otherwise idle machines
+WORKER_NICE_INCREMENT = 0  # Lower worker priority by this much (e.g. 10 keeps the desktop responsive) - POSIX only
+
+INFLIGHT_TASKS_PER_WORKER = 2  # Tasks submitted ahead per worker (keeps workers busy without queuing every file up front)
 INPUT_CACHE_BATCH_SIZE = 2000  # For hybrid batch caching: cache and convert N files at a time (allows full CPU utilization with limited cache space)
+STREAM_NETWORK_INPUT = False  # If True, network files are piped straight into FFmpeg instead of being copied to a local cache first
+CACHE_PREFETCH_BATCHES = 2  # Conversion batches per worker kept cached ahead of the encoders (bounds peak cache usage)
+ADVISE_FILE_ACCESS = True  # Give the kernel page cache hints for WAVs: readahead before conversion, dropped once converted - POSIX only
+ADVISE_WILLNEED_BYTES = 16 * 1024 * 1024  # Start of each WAV prefetched just before its FFmpeg process starts (bounded so other cached data isn't evicted)
+
+def probe_ffmpeg_capabilities(ffmpeg_path: str) -> dict:
+    """
+    Run FFmpeg to find its version and whether it can encode FLAC
+
+    Asks for the FLAC encoder's help page instead of listing every encoder (about 1 KB of
+    output instead of 100 KB).
+
+    Returns:
+        dict: {'ok': bool, 'version': str, 'flac': bool}
+    """
+    result = subprocess.run([ffmpeg_path, '-version'],
+                            capture_output=True,
+                            text=True,
+                            timeout=PREREQUISITE_CHECK_TIMEOUT)
+    if result.returncode != 0:
+        return {'ok': False, 'version': '', 'flac': False}
+
+    # Extract FFmpeg version from output
+    version_line = result.stdout.split('\n')[0]
+    version_parts = version_line.split()
+    version = version_parts[2] if len(version_parts) > 2 else version_line
+
+    flac_test = subprocess.run([ffmpeg_path, '-hide_banner', '-h', 'encoder=flac'],
+                               capture_output=True,
+                               text=True,
+                               timeout=PREREQUISITE_CHECK_TIMEOUT)
+
+    return {'ok': True, 'version': version, 'flac': 'Encoder flac' in flac_test.stdout}
+
+def get_ffmpeg_capabilities(ffmpeg_path: str) -> dict:
+    """
+    Return probe_ffmpeg_capabilities() results, cached on disk per FFmpeg binary
+
+    The cache entry is keyed by the binary's resolved path, size and modification time,
+    so upgrading or replacing FFmpeg triggers a new probe.
+    """
+    binary_path = os.path.realpath(ffmpeg_path)
+    binary_stat = os.stat(binary_path)
+    cache_key = f"{binary_path}|{binary_stat.st_size}|{binary_stat.st_mtime_ns}"
+
+    try:
+        with open(FFMPEG_CAPS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('key') == cache_key:
+            return cached['capabilities']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass  # Missing or unreadable cache - probe again
+
+    capabilities = probe_ffmpeg_capabilities(ffmpeg_path)
+
+    # Only remember working installations so a broken FFmpeg gets rechecked next time
+    if capabilities['ok']:
+        try:
+            FFMPEG_CAPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(FFMPEG_CAPS_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'key': cache_key, 'capabilities': capabilities}, f)
+        except OSError:
+            pass  # Caching is only an optimization
+
+    return capabilities
 
 def check_prerequisites() -> List[str]:
     """Check if all required software is installed"""
@@ -52,23 +160,18 @@ def check_prerequisites() -> List[str]:
     else:
         print("Python version: OK")
     
-    # Check FFmpeg with detailed capability testing
+    # Check FFmpeg with detailed capability testing (cached per FFmpeg binary)
     try:
-        result = subprocess.run(['ffmpeg', '-version'],
-                              capture_output=True,
-                              text=True,
-                              timeout=PREREQUISITE_CHECK_TIMEOUT)
-        if result.returncode == 0:
-            # Extract FFmpeg version from output
-            version_line = result.stdout.split('\n')[0]
-            print(f"FFmpeg: OK ({version_line.split()[2]})")
+        ffmpeg_path = shutil.which('ffmpeg')
+        if ffmpeg_path is None:
+            raise FileNotFoundError('ffmpeg')
+
+        capabilities = get_ffmpeg_capabilities(ffmpeg_path)
+        if capabilities['ok']:
+            print(f"FFmpeg: OK ({capabilities['version']})")
             
             # Test FLAC encoding capability
-            flac_test = subprocess.run(['ffmpeg', '-encoders'],
-                                     capture_output=True,
-                                     text=True,
-                                     timeout=PREREQUISITE_CHECK_TIMEOUT)
-            if 'flac' in flac_test.stdout.lower():
+            if capabilities['flac']:
                 print("FFmpeg FLAC encoder: OK")
             else:
                 issues.append("FFmpeg doesn't support FLAC encoding")
@@ -85,158 +188,573 @@ def check_prerequisites() -> List[str]:
     except Exception as e:
         issues.append(f"FFmpeg check failed: {str(e)}")
         print(f"FFmpeg: ERROR - {str(e)}")
+
+    # The in-process encoder is optional - FFmpeg remains the fallback for every file
+    if USE_NATIVE_ENCODER:
+        if HAS_SOUNDFILE:
+            print(f"libsndfile: OK ({sf.__libsndfile_version__})")
+        else:
+            print("libsndfile: NOT AVAILABLE (install 'soundfile' for in-process encoding, using FFmpeg)")
     
     return issues
 
-def convert_wav_to_flac_ffmpeg(
-    wav_path: Path,
+class FlacSettings(NamedTuple):
+    """FLAC encoder options shared by every conversion"""
+    compression_level: int            # 0 (fastest) - 12 (smallest)
+    block_size: Optional[int] = None  # Samples per FLAC frame, None = encoder default
+    lpc_type: Optional[str] = None    # LPC coefficient search method, None = encoder default
+
+    def ffmpeg_args(self) -> List[str]:
+        """FFmpeg output options for these settings"""
+        args = ['-compression_level', str(self.compression_level)]
+        if self.block_size is not None:
+            args += ['-frame_size', str(self.block_size)]
+        if self.lpc_type is not None:
+            args += ['-lpc_type', self.lpc_type]
+        return args
+
+class ConversionJob(NamedTuple):
+    """Everything a worker needs to convert one WAV file, computed once in the main process"""
+    wav_path: Path        # WAV file to read (the cached copy when caching)
+    relative_path: Path   # Path relative to the input root, used in messages
+    output_path: Path     # FLAC file to write (its directory is pre-created)
+    source_path: Path     # Original WAV file, whose timestamps the FLAC file receives
+    input_size: int       # WAV size in bytes from the directory scan
+
+def create_conversion_jobs(
+    wav_files: List[Tuple[Path, int]],
     input_dir: Path,
-    output_dir: Path,
+    output_dir: Path
+) -> List[ConversionJob]:
+    """Build one ConversionJob per WAV file, mirroring the input folder structure in output_dir"""
+    jobs = []
+    for wav_file, file_size in wav_files:
+        relative_path = wav_file.relative_to(input_dir)
+        output_path = output_dir / relative_path.parent / (wav_file.stem + ".flac")
+        jobs.append(ConversionJob(wav_file, relative_path, output_path, wav_file, file_size))
+    return jobs
+
+def advise_descriptor(fd: int, *advice_names: str, length: int = 0) -> None:
+    """
+    Give the kernel posix_fadvise() hints for the first length bytes of an open file (0 = whole file)
+
+    Advice is passed by name (e.g. 'POSIX_FADV_SEQUENTIAL') because the constants only exist
+    on platforms that support it; elsewhere this does nothing. SEQUENTIAL only affects reads
+    through this open file, while WILLNEED and DONTNEED act on the shared page cache.
+    """
+    if not ADVISE_FILE_ACCESS or not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        for name in advice_names:
+            os.posix_fadvise(fd, 0, length, getattr(os, name))
+    except OSError:
+        pass  # Hints are optional - some filesystems reject them
+
+def advise_file_access(file_path: Path, *advice_names: str, length: int = 0) -> None:
+    """
+    Give the kernel page cache hints for a file that another process will read (see advise_descriptor())
+
+    Only advice acting on the shared page cache (WILLNEED, DONTNEED) is useful here: the
+    descriptor is closed again straight away. Does nothing if the file can't be opened.
+    """
+    if not ADVISE_FILE_ACCESS or not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        advise_descriptor(fd, *advice_names, length=length)
+    finally:
+        os.close(fd)
+
+_ffmpeg_stderr_file = None  # Per-process scratch file receiving FFmpeg's stderr (see run_ffmpeg())
+
+def run_ffmpeg(ffmpeg_cmd: List[str], timeout: float) -> Tuple[int, str]:
+    """
+    Run FFmpeg with stdout discarded and stderr written to a reusable scratch file
+
+    Nothing is piped into or decoded by Python for successful conversions; only when FFmpeg
+    fails is the tail of its stderr read back for the error message.
+
+    Returns:
+        tuple: (returncode, stderr tail - empty on success)
+
+    Raises:
+        subprocess.TimeoutExpired: If FFmpeg runs longer than timeout (it is killed)
+    """
+    global _ffmpeg_stderr_file
+    if _ffmpeg_stderr_file is None:
+        _ffmpeg_stderr_file = tempfile.TemporaryFile()  # One per worker process, deleted automatically
+    _ffmpeg_stderr_file.seek(0)
+    _ffmpeg_stderr_file.truncate()
+
+    returncode = subprocess.run(
+        ffmpeg_cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=_ffmpeg_stderr_file,
+        timeout=timeout,
+        close_fds=True  # Explicitly close file descriptors
+    ).returncode
+
+    if returncode == 0:
+        return returncode, ''
+
+    stderr_size = _ffmpeg_stderr_file.seek(0, os.SEEK_END)
+    _ffmpeg_stderr_file.seek(max(0, stderr_size - FFMPEG_STDERR_TAIL_BYTES))
+    return returncode, _ffmpeg_stderr_file.read().decode('utf-8', errors='replace')
+
+def finalize_converted_file(
+    job: ConversionJob,
+    duration: float,
+    logger: logging.Logger
+) -> Tuple[bool, str, str, int, int, float]:
+    """
+    Verify a freshly written FLAC file, copy the WAV timestamps onto it and build the result tuple
+
+    Args:
+        job: The converted file
+        duration: Time spent converting this file in seconds
+        logger: Logger instance
+
+    Returns:
+        tuple: (success: bool, relative_path: str, message: str, input_size: int, output_size: int, duration: float)
+    """
+    relative_path = job.relative_path
+    input_size = job.input_size
+    output_file_path = job.output_path
+
+    # Get output file size
+    if not output_file_path.exists():
+        error_msg = "Encoder completed but output file not found"
+        logger.error("%s: %s", relative_path, error_msg)
+        return False, str(relative_path), error_msg, input_size, 0, duration
+
+    output_size = output_file_path.stat().st_size
+    compression_ratio = (1 - output_size / input_size) * 100 if input_size > 0 else 0
+
+    # Preserve file timestamps from original WAV to output FLAC
+    # (source_path is the original file even when the cached copy was converted)
+    try:
+        # Get timestamps from original WAV file
+        stat_info = job.source_path.stat()
+        # Copy modification time and access time to FLAC file
+        os.utime(output_file_path, (stat_info.st_atime, stat_info.st_mtime))
+    except (OSError, IOError) as e:
+        logger.warning("%s: Could not preserve file timestamps: %s", relative_path, e)
+
+    # The WAV won't be read again - don't let a large batch push everything else out of the page cache
+    advise_file_access(job.wav_path, 'POSIX_FADV_DONTNEED')
+
+    message = f"Converted to {output_file_path.name} ({compression_ratio:.1f}% smaller, {duration:.2f}s)"
+    # Per-file records use lazy %-formatting: the message is only built if the record is emitted
+    logger.info("%s: %s", relative_path, message)
+    return True, str(relative_path), message, input_size, output_size, duration
+
+def convert_wav_to_flac_ffmpeg(
+    job: ConversionJob,
     ffmpeg_threads: int,
-    compression_level: int,
-    logger: logging.Logger,
-    original_input_dir: Optional[Path] = None
+    flac_settings: FlacSettings,
+    logger: logging.Logger
 ) -> Tuple[bool, str, str, int, int, float]:
     """
     Convert a single WAV file to FLAC format using direct FFmpeg, maintaining directory structure
 
     Args:
-        wav_path: Path to the input WAV file (may be in cache)
-        input_dir: Root input directory (cache dir if caching, original if not)
-        output_dir: Root output directory
+        job: File to convert (paths and size are precomputed by create_conversion_jobs())
         ffmpeg_threads: Number of threads for FFmpeg to use
-        compression_level: FLAC compression level (0-12)
+        flac_settings: FLAC encoder options
         logger: Logger instance
-        original_input_dir: Original input directory (for relative path calculation when caching)
 
     Returns:
         tuple: (success: bool, relative_path: str, message: str, input_size: int, output_size: int, duration: float)
     """
     start_time = time.time()
-    input_size = 0
-    output_size = 0
-    
-    try:
-        # Calculate relative path from the input directory
-        # When using cache, the cache preserves the original directory structure
-        relative_path = wav_path.relative_to(input_dir)
-        
-        # Create output path maintaining directory structure
-        output_filename = wav_path.stem + ".flac"
-        output_file_path = output_dir / relative_path.parent / output_filename
+    relative_path = job.relative_path
+    input_size = job.input_size
 
-        # Note: Output directories are pre-created for performance optimization
-        # No need to call mkdir here (reduces filesystem metadata overhead)
+    # Note: Output directories are pre-created for performance optimization
+    # No need to call mkdir here (reduces filesystem metadata overhead)
 
-        # Get input file size
-        input_size = wav_path.stat().st_size
-        
+    try:
         # Build FFmpeg command with optimization flags and metadata preservation
         ffmpeg_cmd = [
             'ffmpeg',
-            '-i', str(wav_path),           # Input file (may be cached)
+            '-hide_banner',                # Skip version/configuration banner
+            '-f', 'wav',                   # Input is always WAV - skip format probing
+            '-i', str(job.wav_path),       # Input file (may be cached)
             '-threads', str(ffmpeg_threads), # Thread count
             '-c:a', 'flac',                # Audio codec: FLAC
-            '-compression_level', str(compression_level),  # FLAC compression (0=fast, 12=best)
+            *flac_settings.ffmpeg_args(),  # FLAC compression (0=fast, 12=best) and tuning
             '-map_metadata', '0',          # Copy all metadata from input
             '-write_bext', '1',            # Preserve Broadcast Wave Format (BWF) metadata
             '-y',                          # Overwrite output files
             '-v', 'error',                 # Only show errors (reduces overhead)
             '-nostdin',                    # Don't wait for stdin input
-            str(output_file_path)          # Output file
+            str(job.output_path)           # Output file
         ]
         
-        # Run FFmpeg conversion
-        result = subprocess.run(
-            ffmpeg_cmd,
-            capture_output=True,
-            text=True,
-            timeout=FFMPEG_TIMEOUT_SECONDS,
-            close_fds=True  # Explicitly close file descriptors
-        )
+        # Start reading the head of the file into the page cache while FFmpeg starts up
+        advise_file_access(job.wav_path, 'POSIX_FADV_WILLNEED', length=ADVISE_WILLNEED_BYTES)
 
-        # Capture output before they can be garbage collected
-        stdout_output = result.stdout
-        stderr_output = result.stderr
-        returncode = result.returncode
-
-        # Explicitly delete result to free resources immediately
-        del result
+        # Run FFmpeg conversion
+        returncode, stderr_output = run_ffmpeg(ffmpeg_cmd, FFMPEG_TIMEOUT_SECONDS)
 
         duration = time.time() - start_time
 
         if returncode == 0:
-            # Get output file size
-            if output_file_path.exists():
-                output_size = output_file_path.stat().st_size
-                compression_ratio = (1 - output_size / input_size) * 100 if input_size > 0 else 0
-
-                # Preserve file timestamps from original WAV to output FLAC
-                # If we're using cache, get timestamps from the original file location
-                if original_input_dir:
-                    # Caching is enabled - get original file path
-                    original_wav_path = original_input_dir / relative_path
-                else:
-                    # No caching - wav_path is already the original
-                    original_wav_path = wav_path
-
-                try:
-                    # Get timestamps from original WAV file
-                    stat_info = original_wav_path.stat()
-                    # Copy modification time and access time to FLAC file
-                    os.utime(output_file_path, (stat_info.st_atime, stat_info.st_mtime))
-                except (OSError, IOError) as e:
-                    logger.warning(f"{relative_path}: Could not preserve file timestamps: {e}")
-
-                message = f"Converted to {output_filename} ({compression_ratio:.1f}% smaller, {duration:.2f}s)"
-                logger.info(f"{relative_path}: {message}")
-                return True, str(relative_path), message, input_size, output_size, duration
-            else:
-                error_msg = "FFmpeg completed but output file not found"
-                logger.error(f"{relative_path}: {error_msg}")
-                return False, str(relative_path), error_msg, input_size, 0, duration
+            return finalize_converted_file(job, duration, logger)
         else:
-            error_msg = f"FFmpeg error (code {result.returncode}): {result.stderr.strip()}"
-            logger.error(f"{relative_path}: {error_msg}")
+            error_msg = f"FFmpeg error (code {returncode}): {stderr_output.strip()}"
+            logger.error("%s: %s", relative_path, error_msg)
             return False, str(relative_path), error_msg, input_size, 0, duration
             
     except subprocess.TimeoutExpired:
-        try:
-            relative_path = wav_path.relative_to(input_dir)
-        except ValueError:
-            relative_path = wav_path.name
         error_msg = "Conversion timed out (>5 minutes)"
-        logger.error(f"{relative_path}: {error_msg}")
-        return False, str(relative_path), error_msg, input_size, 0, time.time() - start_time
     except subprocess.CalledProcessError as e:
-        try:
-            relative_path = wav_path.relative_to(input_dir)
-        except ValueError:
-            relative_path = wav_path.name
         error_msg = f"FFmpeg process error: {str(e)}"
-        logger.error(f"{relative_path}: {error_msg}")
-        return False, str(relative_path), error_msg, input_size, 0, time.time() - start_time
     except (OSError, IOError) as e:
-        try:
-            relative_path = wav_path.relative_to(input_dir)
-        except ValueError:
-            relative_path = wav_path.name
         error_msg = f"File I/O error: {str(e)}"
-        logger.error(f"{relative_path}: {error_msg}")
-        return False, str(relative_path), error_msg, input_size, 0, time.time() - start_time
     except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+
+    logger.error("%s: %s", relative_path, error_msg)
+    return False, str(relative_path), error_msg, input_size, 0, time.time() - start_time
+
+def convert_wav_to_flac_ffmpeg_piped(
+    job: ConversionJob,
+    ffmpeg_threads: int,
+    flac_settings: FlacSettings,
+    logger: logging.Logger
+) -> Tuple[bool, str, str, int, int, float]:
+    """
+    Convert a single WAV file by streaming it into FFmpeg's stdin
+
+    Used instead of the local cache for network sources (STREAM_NETWORK_INPUT): the WAV is
+    read once with large sequential reads and never written to local disk. The FLAC output
+    still goes straight to a file because FFmpeg seeks back to finish the STREAMINFO header.
+
+    Returns:
+        tuple: Same format as convert_wav_to_flac_ffmpeg()
+    """
+    start_time = time.time()
+    relative_path = job.relative_path
+    input_size = job.input_size
+
+    ffmpeg_cmd = [
+        'ffmpeg',
+        '-hide_banner',
+        '-f', 'wav',                   # Nothing to probe on a pipe
+        '-i', 'pipe:0',                # Input arrives on stdin (also disables keyboard interaction)
+        '-threads', str(ffmpeg_threads),
+        '-c:a', 'flac',
+        *flac_settings.ffmpeg_args(),
+        '-map_metadata', '0',
+        '-write_bext', '1',
+        '-y',
+        '-v', 'error',
+        str(job.output_path)
+    ]
+
+    process = None
+    try:
+        process = subprocess.Popen(
+            ffmpeg_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=CACHE_COPY_BUFFER_SIZE,
+            close_fds=True
+        )
+
+        # Drain stderr in the background so FFmpeg never blocks on a full pipe
+        stderr_chunks: List[bytes] = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+        stderr_reader.start()
+
         try:
-            relative_path = wav_path.relative_to(input_dir)
-        except ValueError:
-            relative_path = wav_path.name
+            with open(job.wav_path, 'rb') as source:
+                # This descriptor does the reading, so the sequential hint raises its readahead
+                advise_descriptor(source.fileno(), 'POSIX_FADV_SEQUENTIAL')
+                shutil.copyfileobj(source, process.stdin, CACHE_COPY_BUFFER_SIZE)
+        except BrokenPipeError:
+            pass  # FFmpeg exited early - its exit code and stderr explain why
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        returncode = process.wait(timeout=FFMPEG_TIMEOUT_SECONDS)
+        stderr_reader.join()
+        duration = time.time() - start_time
+
+        if returncode == 0:
+            return finalize_converted_file(job, duration, logger)
+
+        stderr_output = b''.join(stderr_chunks).decode('utf-8', errors='replace')
+        error_msg = f"FFmpeg error (code {returncode}): {stderr_output.strip()}"
+
+    except subprocess.TimeoutExpired:
+        error_msg = "Conversion timed out (>5 minutes)"
+    except (OSError, IOError) as e:
+        error_msg = f"File I/O error: {str(e)}"
+    except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"{relative_path}: {error_msg}")
-        return False, str(relative_path), error_msg, input_size, 0, time.time() - start_time
+    finally:
+        # Never leave FFmpeg running after a failure
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+
+    logger.error("%s: %s", relative_path, error_msg)
+    return False, str(relative_path), error_msg, input_size, 0, time.time() - start_time
+
+def convert_wav_batch_ffmpeg(
+    jobs: List[ConversionJob],
+    ffmpeg_threads: int,
+    flac_settings: FlacSettings,
+    logger: logging.Logger
+) -> List[Tuple[bool, str, str, int, int, float]]:
+    """
+    Convert several WAV files with a single FFmpeg process
+
+    Every input gets its own '-i' and every output its own '-map N:a ... output.flac' section,
+    so FFmpeg pays its startup and codec initialization cost once for the whole batch.
+    If the batch fails for any reason the files are retried one by one so that a single
+    bad WAV only fails itself and still gets a precise error message.
+
+    Args:
+        jobs: Files to convert
+        ffmpeg_threads: Number of threads for FFmpeg to use
+        flac_settings: FLAC encoder options
+        logger: Logger instance
+
+    Returns:
+        list: One result tuple per input file, same format as convert_wav_to_flac_ffmpeg()
+    """
+    if len(jobs) == 1:
+        return [convert_wav_to_flac_ffmpeg(jobs[0], ffmpeg_threads, flac_settings, logger)]
+
+    start_time = time.time()
+
+    try:
+        # Global options and all inputs first
+        ffmpeg_cmd = ['ffmpeg', '-hide_banner', '-y', '-v', 'error', '-nostdin']
+        for job in jobs:
+            ffmpeg_cmd += ['-f', 'wav', '-i', str(job.wav_path)]  # Forced format skips probing
+
+        # Then one output section per input (options apply to the output that follows them)
+        for index, job in enumerate(jobs):
+            ffmpeg_cmd += [
+                '-map', f'{index}:a',                          # Audio of input N only
+                '-threads', str(ffmpeg_threads),
+                '-c:a', 'flac',
+                *flac_settings.ffmpeg_args(),
+                '-map_metadata', str(index),                   # Metadata of input N only
+                '-write_bext', '1',
+                str(job.output_path)
+            ]
+
+        returncode, stderr_output = run_ffmpeg(ffmpeg_cmd, FFMPEG_TIMEOUT_SECONDS * len(jobs))
+
+        if returncode != 0:
+            raise RuntimeError(f"FFmpeg error (code {returncode}): {stderr_output.strip()}")
+
+    except Exception as e:
+        logger.warning("Batch of %d files failed (%s); retrying files individually", len(jobs), e)
+        return [convert_wav_to_flac_ffmpeg(job, ffmpeg_threads, flac_settings, logger)
+                for job in jobs]
+
+    # Split the batch wall time evenly so per-file averages stay meaningful
+    duration = (time.time() - start_time) / len(jobs)
+
+    return [finalize_converted_file(job, duration, logger) for job in jobs]
+
+def convert_wav_to_flac_native(
+    job: ConversionJob,
+    flac_settings: FlacSettings,
+    logger: logging.Logger
+) -> Optional[Tuple[bool, str, str, int, int, float]]:
+    """
+    Convert a single WAV file to FLAC in-process with libsndfile, maintaining directory structure
+
+    Audio is streamed through one reusable block buffer, so memory use does not depend on file size.
+    Standard text tags are copied; BWF (bext) fields are not, which is why FFmpeg stays the default.
+
+    Args:
+        job: File to convert
+        flac_settings: FLAC encoder options (compression level scaled to libsndfile's 0.0-1.0 range;
+                       block size and LPC type are FFmpeg-only)
+        logger: Logger instance
+
+    Returns:
+        tuple: Same format as convert_wav_to_flac_ffmpeg(), or None if the file should be converted
+        with FFmpeg instead (unsupported sample format or unreadable by libsndfile)
+    """
+    start_time = time.time()
+    relative_path = job.relative_path
+
+    try:
+        with sf.SoundFile(str(job.wav_path), 'r') as infile:
+            output_subtype = NATIVE_FLAC_SUBTYPES.get(infile.subtype)
+            if output_subtype is None:
+                # FLAC cannot store 32-bit or floating point samples losslessly - let FFmpeg decide
+                logger.info("%s: %s samples not supported in-process, using FFmpeg", relative_path, infile.subtype)
+                return None
+
+            with sf.SoundFile(str(job.output_path), 'w',
+                              samplerate=infile.samplerate,
+                              channels=infile.channels,
+                              format='FLAC',
+                              subtype=output_subtype,
+                              compression_level=flac_settings.compression_level / 12) as outfile:
+                # Text tags must be written before any audio data
+                for tag in NATIVE_COPIED_TAGS:
+                    value = getattr(infile, tag)
+                    if value:
+                        setattr(outfile, tag, value)
+
+                # Reuse one buffer for the whole file instead of allocating per block
+                buffer = np.empty((NATIVE_BLOCK_FRAMES, infile.channels), dtype='int32')
+                while True:
+                    frames = infile.read(out=buffer)
+                    if not len(frames):
+                        break
+                    outfile.write(frames)
+
+    except Exception as e:
+        logger.warning("%s: In-process encoding failed (%s), using FFmpeg", relative_path, e)
+        return None
+
+    duration = time.time() - start_time
+    return finalize_converted_file(job, duration, logger)
+
+def convert_wav_batch(
+    jobs: List[ConversionJob],
+    ffmpeg_threads: int,
+    flac_settings: FlacSettings,
+    logger: logging.Logger,
+    pipe_input: bool = False
+) -> List[Tuple[bool, str, str, int, int, float]]:
+    """
+    Convert a batch of WAV files with the in-process encoder when enabled, FFmpeg otherwise
+
+    Files the in-process encoder declines are converted together in one FFmpeg batch, or one
+    by one through FFmpeg's stdin when pipe_input is set.
+
+    Returns:
+        list: One result tuple per input file, same format as convert_wav_to_flac_ffmpeg()
+    """
+    results: List[Tuple[bool, str, str, int, int, float]] = []
+    ffmpeg_jobs: List[ConversionJob] = []
+
+    if USE_NATIVE_ENCODER and HAS_SOUNDFILE:
+        for job in jobs:
+            result = convert_wav_to_flac_native(job, flac_settings, logger)
+            if result is None:
+                ffmpeg_jobs.append(job)
+            else:
+                results.append(result)
+    else:
+        ffmpeg_jobs = jobs
+
+    if ffmpeg_jobs and pipe_input:
+        results.extend(convert_wav_to_flac_ffmpeg_piped(job, ffmpeg_threads, flac_settings, logger)
+                       for job in ffmpeg_jobs)
+    elif ffmpeg_jobs:
+        results.extend(convert_wav_batch_ffmpeg(ffmpeg_jobs, ffmpeg_threads, flac_settings, logger))
+
+    return results
+
+def convert_cached_wav_batch(
+    jobs: List[ConversionJob],
+    ffmpeg_threads: int,
+    flac_settings: FlacSettings,
+    logger: logging.Logger
+) -> List[Tuple[bool, str, str, int, int, float]]:
+    """
+    Convert a batch of cached WAV files, then delete the cached copies
+
+    Removing each cached WAV as soon as its FLAC is written keeps the cache small while
+    the rest of the input is still being copied.
+
+    Returns:
+        list: One result tuple per input file, same format as convert_wav_to_flac_ffmpeg()
+    """
+    try:
+        return convert_wav_batch(jobs, ffmpeg_threads, flac_settings, logger)
+    finally:
+        for job in jobs:
+            try:
+                job.wav_path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("Could not remove cached file %s: %s", job.wav_path, e)
+
+def calculate_batch_limit(total_files: int, parallel_conversions: int) -> int:
+    """Maximum number of small files per FFmpeg batch so every parallel worker receives work"""
+    small_files_limit = max(1, -(-total_files // max(1, parallel_conversions)))  # ceil division
+    return min(FFMPEG_BATCH_SIZE, small_files_limit)
+
+def group_files_for_ffmpeg(jobs: List[ConversionJob], parallel_conversions: int) -> List[List[ConversionJob]]:
+    """
+    Group WAV files into batches for convert_wav_batch_ffmpeg()
+
+    Small files are packed together (up to FFMPEG_BATCH_SIZE per batch) because FFmpeg startup
+    dominates their conversion time. Large files get a batch of their own so a single slow
+    encode never holds back a whole group. Batches are also kept small enough that every
+    parallel worker receives work.
+
+    Args:
+        jobs: Files to convert
+        parallel_conversions: Number of parallel conversions
+
+    Returns:
+        List of batches (lists of conversion jobs)
+    """
+    batch_limit = calculate_batch_limit(len(jobs), parallel_conversions)
+
+    batches: List[List[ConversionJob]] = []
+    current_batch: List[ConversionJob] = []
+
+    for job in jobs:
+        if job.input_size >= FFMPEG_BATCH_MAX_BYTES:
+            batches.append([job])
+            continue
+
+        current_batch.append(job)
+        if len(current_batch) >= batch_limit:
+            batches.append(current_batch)
+            current_batch = []
+
+    if current_batch:
+        batches.append(current_batch)
+
+    return batches
+
+def get_available_cores() -> int:
+    """
+    Number of CPU cores this process may run on
+
+    Respects CPU affinity masks and container/cgroup CPU sets where the OS exposes them
+    (os.sched_getaffinity), falling back to the total core count elsewhere.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        try:
+            return max(1, len(os.sched_getaffinity(0)))
+        except OSError:
+            pass
+    return os.cpu_count() or 1  # Default to 1 if cpu_count returns None
+
+def get_default_thread_count() -> int:
+    """Default number of parallel conversions: half of the available cores"""
+    return max(1, get_available_cores() // 2)
 
 def get_thread_count() -> int:
     """Prompt user for number of parallel conversions to run"""
-    max_cores = os.cpu_count() or 1  # Default to 1 if cpu_count returns None
-    default_cores = max(1, max_cores // 2)  # Default to half of available cores
+    max_cores = get_available_cores()
+    default_cores = get_default_thread_count()  # Default to half of available cores
 
     while True:
         try:
@@ -266,7 +784,7 @@ def calculate_ffmpeg_threads(parallel_conversions: int) -> int:
     Returns:
         Number of threads each FFmpeg process should use
     """
-    max_cores = os.cpu_count() or 1
+    max_cores = get_available_cores()
 
     # Each FFmpeg process should use a fraction of available cores
     # to avoid oversubscription when multiple conversions run in parallel
@@ -379,6 +897,39 @@ def ask_user_about_fast_output() -> bool:
         else:
             print("Please enter 'y' for yes or 'n' for no.")
 
+def create_cache_subdirectory(parent_dir: Path) -> Path:
+    """
+    Create a unique, writable cache subdirectory inside parent_dir
+
+    Returns:
+        Path to the unique cache subdirectory (safe to delete entirely)
+
+    Raises:
+        FileExistsError: If the timestamped subdirectory already exists
+        PermissionError, OSError: If the directory cannot be created or written to
+    """
+    # Try to create the parent directory
+    parent_dir.mkdir(parents=True, exist_ok=True)
+
+    # Finish deleting caches whose background cleanup was cut short by an earlier run exiting
+    for stale_dir in parent_dir.glob(f"wav2flac_cache_*{CACHE_TRASH_SUFFIX}"):
+        start_background_delete(stale_dir)
+
+    # Create a unique subdirectory with timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    unique_cache_dir = parent_dir / f"wav2flac_cache_{timestamp}"
+
+    # Create the unique cache directory
+    unique_cache_dir.mkdir(parents=False, exist_ok=False)
+
+    # Test write permissions
+    test_file = unique_cache_dir / "test_write.tmp"
+    test_file.write_text("test")
+    test_file.unlink()
+
+    print(f"Cache subdirectory created: {unique_cache_dir.name}")
+    return unique_cache_dir
+
 def get_cache_directory() -> Path:
     """
     Prompt user for cache directory location and create a unique subdirectory.
@@ -405,26 +956,8 @@ def get_cache_directory() -> Path:
             print("Please try another location.")
             continue
 
-        parent_dir = Path(cache_path)
-
         try:
-            # Try to create the parent directory
-            parent_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create a unique subdirectory with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            unique_cache_dir = parent_dir / f"wav2flac_cache_{timestamp}"
-
-            # Create the unique cache directory
-            unique_cache_dir.mkdir(parents=False, exist_ok=False)
-
-            # Test write permissions
-            test_file = unique_cache_dir / "test_write.tmp"
-            test_file.write_text("test")
-            test_file.unlink()
-
-            print(f"Cache subdirectory created: {unique_cache_dir.name}")
-            return unique_cache_dir
+            return create_cache_subdirectory(Path(cache_path))
 
         except FileExistsError:
             # Extremely unlikely, but retry with a different timestamp
@@ -436,14 +969,71 @@ def get_cache_directory() -> Path:
             print(f"Error: Cannot create/access directory '{cache_path}': {e}")
             print("Please try another location.")
 
+def copy_file_to_cache(source: Path, destination: Path) -> None:
+    """
+    Copy a file's contents with large buffers, then its timestamps and permissions
+
+    Uses zero-copy os.sendfile() on Linux, otherwise a buffered copy with
+    CACHE_COPY_BUFFER_SIZE chunks instead of shutil's small default buffer.
+    """
+    with open(source, 'rb', buffering=0) as src, open(destination, 'wb', buffering=0) as dst:
+        if sys.platform.startswith('linux'):
+            try:
+                offset = 0
+                while True:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, CACHE_COPY_BUFFER_SIZE)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # Some filesystems don't support sendfile - start over with a buffered copy
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+                shutil.copyfileobj(src, dst, length=CACHE_COPY_BUFFER_SIZE)
+        else:
+            shutil.copyfileobj(src, dst, length=CACHE_COPY_BUFFER_SIZE)
+
+    shutil.copystat(source, destination)
+
+def link_file_to_cache(source: Path, destination: Path) -> bool:
+    """
+    Make destination share source's data without copying any bytes
+
+    Tries a hardlink first, then a reflink (FICLONE) on Linux. Both only work when source
+    and destination are on the same filesystem.
+
+    Returns:
+        True if the file was linked, False if it has to be copied
+    """
+    try:
+        os.link(source, destination)
+        return True
+    except OSError:
+        pass
+
+    if sys.platform.startswith('linux'):
+        import fcntl
+        try:
+            with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            shutil.copystat(source, destination)
+            return True
+        except OSError:
+            destination.unlink(missing_ok=True)
+
+    return False
+
 def copy_single_file_to_cache(
     wav_file: Path,
+    file_size: int,
     input_dir: Path,
     cache_dir: Path,
     file_index: int,
-    total_files: int
+    total_files: int,
+    same_filesystem: bool = False
 ) -> Tuple[bool, Optional[Path], Path, int, float, int, int] | Tuple[bool, None, Path, int, float, int, int, str]:
-    """Copy a single WAV file to local cache"""
+    """Copy a single WAV file to local cache (hardlinked or reflinked instead when on the same filesystem)"""
     try:
         relative_path = wav_file.relative_to(input_dir)
         cached_file = cache_dir / relative_path
@@ -451,16 +1041,11 @@ def copy_single_file_to_cache(
         # Create subdirectories in cache
         cached_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Verify source file exists and get size
-        try:
-            file_size = wav_file.stat().st_size
-        except (OSError, IOError) as e:
-            return False, None, relative_path, 0, 0, file_index, total_files, f"Cannot read source file: {str(e)}"
-
         # Copy file
         start_time = time.time()
 
-        shutil.copy2(wav_file, cached_file)
+        if not (same_filesystem and link_file_to_cache(wav_file, cached_file)):
+            copy_file_to_cache(wav_file, cached_file)
 
         # Verify the cached file size matches the source
         cached_size = cached_file.stat().st_size
@@ -486,10 +1071,13 @@ def copy_single_file_to_cache(
             relative_path = Path(wav_file.name)
         return False, None, relative_path, 0, 0, file_index, total_files, f"Unexpected error: {str(e)}"
 
-def check_cache_disk_space(wav_files: List[Path], cache_dir: Path, logger: logging.Logger) -> bool:
-    """Check if cache directory has enough space for all WAV files"""
-    # Calculate total size of all WAV files
-    total_size_bytes = sum(f.stat().st_size for f in wav_files)
+def check_cache_disk_space(total_size_bytes: int, cache_dir: Path, logger: logging.Logger, interactive: bool = True) -> bool:
+    """
+    Check if cache directory has enough space for all WAV files (total_size_bytes combined)
+
+    If free space cannot be determined the user is asked whether to continue; without
+    interactive prompts that answer defaults to no.
+    """
     total_size_gb = total_size_bytes / (1024 ** 3)
     
     try:
@@ -521,6 +1109,9 @@ def check_cache_disk_space(wav_files: List[Path], cache_dir: Path, logger: loggi
     except (OSError, PermissionError) as e:
         error_msg = f"Could not check disk space: {e}"
         print(f"Warning: {error_msg}")
+
+        if not interactive:
+            return False
         
         # Ask user if they want to proceed anyway
         while True:
@@ -532,69 +1123,239 @@ def check_cache_disk_space(wav_files: List[Path], cache_dir: Path, logger: loggi
             else:
                 print("Please enter 'y' for yes or 'n' for no.")
 
-def copy_files_to_cache(
-    wav_files: List[Path],
+class ProgressReporter:
+    """Progress display: a tqdm bar when available, otherwise progress lines printed at most every PROGRESS_PRINT_MIN_INTERVAL"""
+
+    def __init__(self, total: int, label: str):
+        self.total = total
+        self.label = label
+        self.count = 0
+        self.last_print_time = 0.0
+        self.bar = tqdm(total=total, desc=label, unit='file') if HAS_TQDM else None
+
+    def update(self, count: int = 1) -> None:
+        self.count += count
+        if self.bar is not None:
+            self.bar.update(count)  # tqdm limits its own redraw rate
+            return
+
+        now = time.monotonic()
+        if self.count >= self.total or now - self.last_print_time >= PROGRESS_PRINT_MIN_INTERVAL:
+            self.last_print_time = now
+            print(f"{self.label} {self.count}/{self.total} files...", flush=True)
+
+    def write(self, message: str) -> None:
+        """Print a message without breaking the progress bar"""
+        if self.bar is not None:
+            tqdm.write(message)
+        else:
+            print(message)
+
+    def close(self) -> None:
+        if self.bar is not None:
+            self.bar.close()
+
+def iter_conversion_results(
+    executor: ProcessPoolExecutor,
+    file_batches: List[List[ConversionJob]],
+    ffmpeg_threads: int,
+    flac_settings: FlacSettings,
+    parallel_conversions: int,
+    logger: logging.Logger,
+    pipe_input: bool = False
+) -> Iterator[Tuple[bool, str, str, int, int, float]]:
+    """
+    Convert batches of WAV files in place and yield per-file results as they complete
+
+    With pipe_input, FFmpeg reads each file through its stdin (see convert_wav_to_flac_ffmpeg_piped()).
+    Only INFLIGHT_TASKS_PER_WORKER tasks per worker are submitted at a time; each finished
+    task is replaced by the next one, so memory and executor queue traffic stay proportional
+    to the number of workers rather than the number of files. Finished futures are handed
+    over through a SimpleQueue by done-callbacks, so each completion wakes this loop once
+    without re-registering waiters on every in-flight future.
+
+    Yields:
+        tuple: Result tuple per file, same format as convert_wav_to_flac_ffmpeg()
+    """
+    pending_tasks = iter(file_batches)
+    max_inflight = max(1, parallel_conversions * INFLIGHT_TASKS_PER_WORKER)
+    logger.info(f"Processing {len(file_batches)} tasks with up to {max_inflight} in flight")
+
+    done_queue = queue.SimpleQueue()  # Futures in completion order, filled by done-callbacks
+    inflight = 0
+
+    def submit(task_files: List[ConversionJob]) -> None:
+        # Each task converts one or more files
+        future = executor.submit(convert_wav_batch, task_files, ffmpeg_threads, flac_settings, logger, pipe_input)
+        future.add_done_callback(done_queue.put)
+
+    for task_files in itertools.islice(pending_tasks, max_inflight):
+        submit(task_files)
+        inflight += 1
+
+    while inflight:
+        future = done_queue.get()
+        inflight -= 1
+
+        # Refill the window before handling results so no worker waits on the main process
+        next_task = next(pending_tasks, None)
+        if next_task is not None:
+            submit(next_task)
+            inflight += 1
+
+        yield from future.result()
+
+def iter_cached_conversion_results(
+    executor: ProcessPoolExecutor,
+    jobs: List[ConversionJob],
     input_dir: Path,
     cache_dir: Path,
+    ffmpeg_threads: int,
+    flac_settings: FlacSettings,
+    parallel_conversions: int,
     logger: logging.Logger
-) -> Tuple[List[Path], List[Tuple[Path, str]]]:
-    """Copy WAV files to local cache using optimized concurrent threads"""
-    print("Copying files to local cache...")
-    
-    cached_files = []
-    failed_copies = []
-    total_size = 0
-    completed_count = 0
-    start_time = time.time()
-    
-    # Use more threads for I/O operations (copying is I/O bound, not CPU bound)
-    copy_threads = min(CACHE_COPY_THREADS, len(wav_files))
-    
-    # Use ThreadPoolExecutor for file copying
-    with ThreadPoolExecutor(max_workers=copy_threads) as executor:
-        # Submit all copy tasks
-        future_to_file = {
-            executor.submit(copy_single_file_to_cache, wav_file, input_dir, cache_dir, i+1, len(wav_files)): wav_file 
-            for i, wav_file in enumerate(wav_files)
-        }
-        
-        # Process completed tasks as they finish
-        for future in as_completed(future_to_file):
+) -> Iterator[Tuple[bool, str, str, int, int, float]]:
+    """
+    Copy WAV files into the local cache and convert them as they land
+
+    Copy threads and conversion workers run at the same time, so network reads, cache writes
+    and FLAC encoding overlap instead of running one after the other. Each cached file is
+    deleted by the worker once converted, and copying only runs CACHE_PREFETCH_BATCHES
+    batches per worker ahead of the encoders, so the cache never holds the whole input.
+    Files below CACHE_MIN_FILE_SIZE skip the cache and are converted from the input directly.
+
+    Args:
+        executor: Process pool running the conversions
+        jobs: Files to convert (reading from the original input)
+        input_dir: Original input directory
+        cache_dir: Local cache directory
+        ffmpeg_threads: Number of threads per FFmpeg process
+        flac_settings: FLAC encoder options
+        parallel_conversions: Number of conversion workers
+        logger: Logger instance
+
+    Yields:
+        tuple: Result tuple per file, same format as convert_wav_to_flac_ffmpeg().
+        Files that could not be cached are reported as failed conversions.
+    """
+    total_files = len(jobs)
+    batch_limit = calculate_batch_limit(total_files, parallel_conversions)
+    prefetch_limit = max(CACHE_COPY_THREADS, parallel_conversions * batch_limit * CACHE_PREFETCH_BATCHES)
+    logger.info(f"Streaming files through cache: up to {prefetch_limit} files cached ahead of conversion")
+
+    # On the same filesystem the cache can link to the originals instead of copying them
+    try:
+        same_filesystem = os.stat(input_dir).st_dev == os.stat(cache_dir).st_dev
+    except OSError:
+        same_filesystem = False
+    if same_filesystem:
+        logger.info("Cache is on the same filesystem as the input: linking files instead of copying")
+
+    pending_jobs = iter(enumerate(jobs))
+    files_exhausted = False
+    copy_futures = {}  # future -> job whose file it copies
+    conversion_futures = {}  # future -> number of cached files it converts
+    cached_files_in_use = 0  # Files (cached or read directly) waiting for or undergoing conversion
+    current_batch: List[ConversionJob] = []
+    direct_batch: List[ConversionJob] = []  # Small files converted without caching
+    cached_count = 0
+    failed_copies = 0
+    cache_progress = ProgressReporter(sum(1 for job in jobs if job.input_size >= CACHE_MIN_FILE_SIZE), "Cached")
+    done_queue = queue.SimpleQueue()  # Finished copy and conversion futures, filled by done-callbacks
+
+    def submit_conversion(batch: List[ConversionJob], convert=convert_cached_wav_batch) -> None:
+        future = executor.submit(convert, batch, ffmpeg_threads, flac_settings, logger)
+        conversion_futures[future] = len(batch)
+        future.add_done_callback(done_queue.put)
+
+    with ThreadPoolExecutor(max_workers=min(CACHE_COPY_THREADS, max(1, total_files))) as copy_executor:
+        while True:
+            # Keep the copy threads busy without caching too far ahead of the encoders
+            while not files_exhausted and len(copy_futures) + cached_files_in_use < prefetch_limit:
+                try:
+                    i, job = next(pending_jobs)
+                except StopIteration:
+                    files_exhausted = True
+                    break
+                if job.input_size < CACHE_MIN_FILE_SIZE:
+                    # Caching a small file costs as much I/O as converting it in place
+                    direct_batch.append(job)
+                    cached_files_in_use += 1
+                    if len(direct_batch) >= batch_limit:
+                        submit_conversion(direct_batch, convert_wav_batch)
+                        direct_batch = []
+                    continue
+                future = copy_executor.submit(copy_single_file_to_cache, job.source_path, job.input_size,
+                                              input_dir, cache_dir, i+1, total_files, same_filesystem)
+                copy_futures[future] = job
+                future.add_done_callback(done_queue.put)
+
+            if direct_batch and files_exhausted:
+                submit_conversion(direct_batch, convert_wav_batch)
+                direct_batch = []
+
+            # Don't hold back a partial batch once no more copies are in flight
+            if current_batch and (len(current_batch) >= batch_limit or not copy_futures):
+                submit_conversion(current_batch)
+                current_batch = []
+
+            if not copy_futures and not conversion_futures:
+                break
+
+            future = done_queue.get()
+
+            if future in conversion_futures:
+                cached_files_in_use -= conversion_futures.pop(future)
+                yield from future.result()
+                continue
+
+            job = copy_futures.pop(future)
             result = future.result()
-            
+
             if result[0]:  # Success
                 success, cached_file, relative_path, file_size, copy_speed, file_index, total_files = result
-                cached_files.append(cached_file)
-                total_size += file_size
-                completed_count += 1
-                
-                # Show progress every N files or for small batches
-                if completed_count % PROGRESS_REPORT_INTERVAL == 0 or len(wav_files) <= CONVERSION_PROGRESS_THRESHOLD:
-                    print(f"Cached {completed_count}/{total_files} files...")
-                    sys.stdout.flush()  # Force output to appear immediately
-                
+                cached_count += 1
+                cached_files_in_use += 1
+
+                # Convert the cached copy; timestamps still come from the original
+                cached_job = job._replace(wav_path=cached_file)
+                if file_size >= FFMPEG_BATCH_MAX_BYTES:
+                    submit_conversion([cached_job])
+                else:
+                    current_batch.append(cached_job)
+
+                cache_progress.update()
+
             else:  # Failed
                 success, cached_file, relative_path, file_size, copy_speed, file_index, total_files, error_msg = result
-                failed_copies.append((future_to_file[future], error_msg))
-                completed_count += 1
+                failed_copies += 1
+                cache_progress.update()
+                logger.error("Cache failed: %s - %s", relative_path, error_msg)
+                yield False, str(relative_path), f"Cache failed: {error_msg}", 0, 0, 0
 
-                logger.error(f"Cache failed: {relative_path} - {error_msg}")
-                print(f"Cache failed: {relative_path}")
-                sys.stdout.flush()
-    
-    # Final summary
-    print(f"Caching completed: {len(cached_files)} files ready for conversion")
-    if failed_copies:
-        print(f"{len(failed_copies)} files failed to cache and will be skipped")
-    
-    return cached_files, failed_copies
+    cache_progress.close()
+    logger.info(f"Caching completed: {cached_count} files cached, {failed_copies} failed")
+
+def start_background_delete(directory: Path) -> threading.Thread:
+    """
+    Delete a directory tree in a background thread
+
+    The thread is not a daemon, so the interpreter finishes the deletion before exiting,
+    but everything else (summary, log shutdown) carries on in the meantime.
+    """
+    thread = threading.Thread(target=shutil.rmtree, args=(directory,), kwargs={'ignore_errors': True},
+                              name=f"delete-{directory.name}")
+    thread.start()
+    return thread
 
 def cleanup_cache(cache_dir: Path, logger: Optional[logging.Logger]) -> None:
     """
     Clean up the temporary cache directory created by get_cache_directory().
 
     This function safely deletes the unique cache subdirectory (e.g., wav2flac_cache_20250113_143022)
-    that was created specifically for this conversion session.
+    that was created specifically for this conversion session. The directory is renamed to
+    '<name>.trash' at once and deleted in the background; if the process exits before that
+    finishes, the next run using the same cache location removes it.
 
     Args:
         cache_dir: Path to the unique cache subdirectory to delete
@@ -617,15 +1378,14 @@ def cleanup_cache(cache_dir: Path, logger: Optional[logging.Logger]) -> None:
 
         print(f"Cleaning up cache directory: {cache_dir.name}...")
 
-        # Count files before deletion for logging
-        file_count = sum(1 for _ in cache_dir.rglob('*') if _.is_file())
-
-        # Delete the entire unique cache subdirectory
-        shutil.rmtree(cache_dir)
+        # Renaming is instant; the files are deleted without holding up the rest of shutdown
+        trash_dir = cache_dir.with_name(cache_dir.name + CACHE_TRASH_SUFFIX)
+        cache_dir.rename(trash_dir)
+        start_background_delete(trash_dir)
 
-        print(f"Cache cleanup completed. Removed {file_count} cached files.")
+        print("Cache cleanup started in the background.")
         if logger:
-            logger.info(f"Cache cleanup: deleted {file_count} files from {cache_dir}")
+            logger.info(f"Cache cleanup: deleting {cache_dir} in the background")
 
     except (OSError, PermissionError) as e:
         error_msg = f"Error during cache cleanup: {e}"
@@ -634,33 +1394,100 @@ def cleanup_cache(cache_dir: Path, logger: Optional[logging.Logger]) -> None:
         if logger:
             logger.error(f"Cache cleanup failed: {e}", exc_info=True)
 
-def setup_logging(output_dir: Path) -> Tuple[logging.Logger, Path]:
-    """Set up logging to file only (not console)"""
+def get_worker_context() -> multiprocessing.context.BaseContext:
+    """
+    Multiprocessing context for the conversion worker processes
+
+    forkserver (POSIX) starts workers from a small, clean server process instead of forking
+    the main process with its threads and open files; spawn is used where it isn't available.
+    Queues and shared values handed to the workers must come from this same context.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+def setup_logging(output_dir: Path) -> Tuple[logging.Logger, Path, logging.handlers.QueueListener]:
+    """
+    Set up logging to file only (not console)
+
+    Records are put on a queue and written to disk by a single listener thread, so the main
+    process and the conversion workers never wait on file writes or the handler lock.
+
+    Returns:
+        tuple: (logger, log_path, log_listener) - stop the listener with stop_log_listener()
+    """
     # Create log filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_filename = f"wav_to_flac_conversion_{timestamp}.log"
     log_path = output_dir / log_filename
     
-    # Get the root logger and clear any existing handlers
+    file_handler = logging.FileHandler(log_path, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    # A multiprocessing queue so worker processes can log through the same listener
+    log_queue = get_worker_context().Queue(-1)
+    log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    log_listener.start()
+
+    # Get the root logger and route everything through the queue (no console handler)
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    
-    # Configure logging to file only (no console handler)
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_path, encoding='utf-8')
-        ],
-        force=True  # Force reconfiguration
-    )
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
     
     logger = logging.getLogger(__name__)
     logger.info("="*80)
     logger.info("OPTIMIZED WAV to FLAC Conversion Log Started")
     logger.info("="*80)
     
-    return logger, log_path
+    return logger, log_path, log_listener
+
+def stop_log_listener(log_listener: logging.handlers.QueueListener) -> None:
+    """Flush queued log records and write any later records directly to the log file"""
+    log_listener.stop()
+
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    for handler in log_listener.handlers:
+        root_logger.addHandler(handler)
+
+def init_conversion_worker(log_queue: multiprocessing.Queue, worker_counter, cores_per_worker: int) -> None:
+    """
+    Initializer for conversion worker processes.
+
+    Each worker process gets its own interpreter (and GIL), so logging has to be configured
+    again: records are sent to the main process's log listener through the shared queue.
+    Optionally pins the worker to its own block of cores (FFmpeg child processes inherit
+    the affinity, keeping each encoder's working set in one core's cache) and lowers its priority.
+
+    Args:
+        log_queue: Queue drained by the listener from setup_logging()
+        worker_counter: Shared multiprocessing.Value used to number the workers
+        cores_per_worker: Cores given to each worker when pinning (FFmpeg threads per process)
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+
+    with worker_counter.get_lock():
+        worker_index = worker_counter.value
+        worker_counter.value += 1
+
+    if PIN_WORKER_CPU_AFFINITY and hasattr(os, 'sched_setaffinity'):
+        try:
+            cores = sorted(os.sched_getaffinity(0))
+            start = (worker_index * cores_per_worker) % len(cores)
+            worker_cores = {cores[(start + i) % len(cores)] for i in range(min(cores_per_worker, len(cores)))}
+            os.sched_setaffinity(0, worker_cores)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"Could not set CPU affinity for worker {worker_index}: {e}")
+
+    if WORKER_NICE_INCREMENT and hasattr(os, 'nice'):
+        try:
+            os.nice(WORKER_NICE_INCREMENT)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"Could not lower priority of worker {worker_index}: {e}")
 
 def format_duration(seconds: float) -> str:
     """
@@ -680,15 +1507,70 @@ def format_duration(seconds: float) -> str:
     else:
         return f"{remaining_seconds}s"
 
-def find_wav_files(directory: Path) -> List[Path]:
-    """Find all WAV files in the given directory and all subdirectories"""
-    wav_files: List[Path] = []
+def _iter_wav_files(directory: str) -> Iterator[Tuple[Path, int]]:
+    """Recursively yield (path, size) for WAV files below a directory using a single os.scandir() pass"""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_wav_files(entry.path)
+                elif WAV_FILENAME_PATTERN.search(entry.name):
+                    # DirEntry caches stat data (free on Windows, one call elsewhere),
+                    # so sizes never need to be fetched again later
+                    try:
+                        file_size = entry.stat().st_size
+                    except OSError:
+                        file_size = 0  # Keep the file - its conversion will report the error
+                    yield Path(entry.path), file_size
+    except OSError:
+        # Unreadable directory (permissions, vanished share) - skip it like rglob() did
+        return
+
+def find_wav_files(directory: Path) -> List[Tuple[Path, int]]:
+    """Find all WAV files in the given directory and all subdirectories, with their sizes in bytes"""
+    # One traversal with a case-insensitive extension check: every file is seen exactly once,
+    # so no de-duplication is needed (two rglob() passes used to walk the tree twice)
+    return sorted(_iter_wav_files(str(directory)))
+
+def is_already_converted(wav_file: Path, flac_file: Path) -> bool:
+    """
+    Check whether a WAV file was fully converted by an earlier run
+
+    Completed conversions get the WAV's modification time copied onto the FLAC file, so a
+    non-empty FLAC with the same mtime is up to date. A FLAC left behind by an interrupted
+    run has a newer mtime and is converted again, as is any WAV modified since.
+    """
+    try:
+        flac_stat = flac_file.stat()
+    except OSError:
+        return False  # Not converted yet (most common case - no source stat needed)
+
+    if flac_stat.st_size == 0:
+        return False
+
+    try:
+        wav_mtime = wav_file.stat().st_mtime
+    except OSError:
+        return False
 
-    # Recursively look for files with .wav extension (case insensitive)
-    wav_files.extend(directory.rglob('*.wav'))
-    wav_files.extend(directory.rglob('*.WAV'))
+    return abs(flac_stat.st_mtime - wav_mtime) <= CONVERTED_MTIME_TOLERANCE
 
-    return sorted(set(wav_files))  # Remove duplicates and sort
+def skip_converted_files(
+    wav_files: List[Tuple[Path, int]],
+    input_dir: Path,
+    output_dir: Path,
+    logger: logging.Logger
+) -> List[Tuple[Path, int]]:
+    """Return only the WAV files whose FLAC output in output_dir is missing or out of date"""
+    remaining = []
+    for wav_file, file_size in wav_files:
+        relative_path = wav_file.relative_to(input_dir)
+        flac_file = output_dir / relative_path.parent / (wav_file.stem + ".flac")
+        if is_already_converted(wav_file, flac_file):
+            logger.debug("Skipping %s: already converted", relative_path)
+        else:
+            remaining.append((wav_file, file_size))
+    return remaining
 
 def create_output_directory(input_dir: Path) -> Path:
     """Create output directory with '_converted' suffix"""
@@ -700,7 +1582,7 @@ def create_output_directory(input_dir: Path) -> Path:
 
     return output_dir
 
-def precreate_output_directories(wav_files: List[Path], input_dir: Path, output_dir: Path, logger: logging.Logger) -> int:
+def precreate_output_directories(jobs: List[ConversionJob], logger: logging.Logger) -> int:
     """
     Pre-create all output directories to eliminate mkdir overhead during conversion.
 
@@ -708,20 +1590,14 @@ def precreate_output_directories(wav_files: List[Path], input_dir: Path, output_
     metadata operations from thousands to just a few dozen.
 
     Args:
-        wav_files: List of WAV files to be converted
-        input_dir: Root input directory
-        output_dir: Root output directory
+        jobs: Files to be converted
         logger: Logger instance
 
     Returns:
         Number of unique directories created
     """
     # Collect all unique output directories needed
-    unique_dirs = set()
-    for wav_file in wav_files:
-        relative_path = wav_file.relative_to(input_dir)
-        output_subdir = output_dir / relative_path.parent
-        unique_dirs.add(output_subdir)
+    unique_dirs = {job.output_path.parent for job in jobs}
 
     print(f"Pre-creating {len(unique_dirs)} output directories...")
     logger.info(f"Pre-creating {len(unique_dirs)} output directories to optimize performance")
@@ -864,7 +1740,63 @@ def cleanup_output_cache(temp_output_dir: Path, logger: Optional[logging.Logger]
         if logger:
             logger.error(f"Temp cache cleanup failed: {e}", exc_info=True)
 
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command line options
+
+    Any setting not given on the command line is asked interactively, unless --no-prompt
+    is used, in which case the interactive defaults apply and nothing waits for input.
+    """
+    parser = argparse.ArgumentParser(
+        description="Recursively convert WAV files to FLAC, keeping the folder structure",
+        epilog="Example: wav2flac_cmdline.py --no-prompt --input /data/session1 --compression-level 8\n\n"
+               "Levels 5-8 encode much faster than 12 and are usually only slightly larger;\n"
+               "--flac-block-size and --lpc-type fine-tune that trade-off.",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--input', type=Path, metavar='DIR',
+                        help="directory containing WAV files (searched recursively)")
+    parser.add_argument('--compression-level', type=int, choices=range(0, 13), metavar='0-12',
+                        help=f"FLAC compression level (default: {DEFAULT_COMPRESSION_LEVEL})")
+    parser.add_argument('--flac-block-size', type=int, metavar='SAMPLES',
+                        help="FLAC block size in samples, 16-65535 (default: chosen by the encoder)")
+    parser.add_argument('--lpc-type', choices=['none', 'fixed', 'levinson', 'cholesky'],
+                        help="FLAC LPC coefficient method (default: chosen by the encoder from the compression level)")
+    parser.add_argument('--threads', type=int, metavar='N',
+                        help="number of parallel conversions (default: half of the CPU cores; at most 4 with --no-cache)")
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument('--cache-dir', type=Path, metavar='DIR',
+                             help="input is a network share: cache files in a temporary folder inside DIR")
+    cache_group.add_argument('--no-cache', action='store_true',
+                             help="input is local: convert files in place without caching")
+    parser.add_argument('--fast-output', action=argparse.BooleanOptionalAction, default=None,
+                        help="write FLAC files to the system temp directory first, then move them (default: yes)")
+    parser.add_argument('--force', action='store_true',
+                        help="re-convert files even if an up-to-date FLAC file already exists")
+    parser.add_argument('--no-prompt', action='store_true',
+                        help="never ask questions: use defaults for missing options and skip the confirmation")
+    args = parser.parse_args()
+
+    if args.input is not None:
+        if not validate_path(str(args.input)) or not args.input.is_dir():
+            parser.error(f"--input: '{args.input}' does not exist or is not a directory")
+    elif args.no_prompt:
+        parser.error("--no-prompt requires --input")
+
+    if args.flac_block_size is not None and not 16 <= args.flac_block_size <= 65535:
+        parser.error("--flac-block-size must be between 16 and 65535")
+
+    if args.threads is not None and not 1 <= args.threads <= get_available_cores():
+        parser.error(f"--threads must be between 1 and {get_available_cores()}")
+
+    if args.cache_dir is not None and not validate_path(str(args.cache_dir)):
+        parser.error(f"--cache-dir: '{args.cache_dir}' contains invalid or unsafe characters")
+
+    return args
+
 def main() -> None:
+    args = parse_arguments()
+
     print("=" * 70)
     print(f"OPTIMIZED WAV to FLAC Converter v{APP_VERSION}")
     print("Maximum performance through FFmpeg's native multithreading")
@@ -891,37 +1823,71 @@ def main() -> None:
     print("-" * 40)
     
     # Get input directory
-    input_dir = get_input_directory()
+    input_dir = args.input if args.input is not None else get_input_directory()
     print(f"Input directory: {input_dir}")
     
-    # Ask user if they want to use caching
-    use_cache = ask_user_about_caching()
+    # Ask user if they want to use caching (unless given on the command line)
+    if args.cache_dir is not None:
+        use_cache = True
+    elif args.no_cache or args.no_prompt:
+        use_cache = False
+    else:
+        use_cache = ask_user_about_caching()
+    stream_input = use_cache and STREAM_NETWORK_INPUT  # Pipe network files into FFmpeg instead of caching
     cache_dir = None
     original_input_dir = input_dir  # Keep reference to original
 
-    if use_cache:
+    if stream_input:
+        print("Network files will be streamed directly into FFmpeg (no local cache needed).")
+    elif args.cache_dir is not None:
+        try:
+            cache_dir = create_cache_subdirectory(args.cache_dir)
+        except Exception as e:
+            print(f"Error: Cannot create/access cache directory '{args.cache_dir}': {e}")
+            sys.exit(1)
+        print(f"Temporary cache created: {cache_dir}")
+    elif use_cache:
         cache_dir = get_cache_directory()
         print(f"Temporary cache created: {cache_dir}")
     else:
         print("Proceeding without caching.")
 
     # Ask user if they want to use fast output cache
-    use_fast_output = ask_user_about_fast_output()
+    if args.fast_output is not None:
+        use_fast_output = args.fast_output
+    elif args.no_prompt:
+        use_fast_output = True  # Same default as the interactive question
+    else:
+        use_fast_output = ask_user_about_fast_output()
     temp_output_dir = None
 
     # Get compression level
-    compression_level = get_compression_level()
+    if args.compression_level is not None:
+        compression_level = args.compression_level
+    elif args.no_prompt:
+        compression_level = DEFAULT_COMPRESSION_LEVEL
+    else:
+        compression_level = get_compression_level()
     print(f"FLAC compression level: {compression_level}")
+    flac_settings = FlacSettings(compression_level, args.flac_block_size, args.lpc_type)
     
     # Get number of parallel conversions to run
-    thread_count = get_thread_count()
+    if args.threads is not None:
+        thread_count = args.threads
+    elif args.no_prompt:
+        thread_count = get_default_thread_count()
+    else:
+        thread_count = get_thread_count()
 
     # Calculate FFmpeg threads based on caching mode
-    max_cores = os.cpu_count() or 1
+    max_cores = get_available_cores()
     if not use_cache:
-        # No caching - limited parallel conversion (4 files at a time) to avoid network/RAID I/O thrashing
-        thread_count = 4
-        ffmpeg_threads = max(1, max_cores // thread_count)  # Divide cores among 4 processes
+        # No caching - limited parallel conversion (up to 4 files at a time) to avoid network/RAID I/O thrashing
+        if args.threads is not None:
+            thread_count = min(4, args.threads)  # Explicit --threads is honoured up to the same limit
+        else:
+            thread_count = min(4, max_cores)  # Never more processes than cores
+        ffmpeg_threads = max(1, max_cores // thread_count)  # Divide cores among the processes
         print(f"Sequential conversion mode: processing {thread_count} files at a time with {ffmpeg_threads} thread(s) per file")
         print(f"   Run with --cache-dir option for full parallel processing")
     else:
@@ -935,20 +1901,23 @@ def main() -> None:
     print(f"Output directory: {output_dir}")
 
     # Set up logging
-    logger, log_path = setup_logging(output_dir)
+    logger, log_path, log_listener = setup_logging(output_dir)
     logger.info(f"Log file created: {log_path}")
     logger.info("Prerequisites check completed successfully")
     logger.info(f"Input directory: {original_input_dir}")
     logger.info(f"Parallel conversions: {thread_count}")
-    logger.info(f"FFmpeg threads per process: {ffmpeg_threads}")
+    logger.info(f"FFmpeg threads per process: {ffmpeg_threads} ({thread_count * ffmpeg_threads} of {max_cores} cores in use)")
     logger.info(f"FLAC compression level: {compression_level}")
+    if args.flac_block_size is not None or args.lpc_type is not None:
+        logger.info(f"FLAC block size: {args.flac_block_size or 'default'}, LPC type: {args.lpc_type or 'default'}")
+    logger.info(f"Encoder: {'libsndfile (in-process)' if USE_NATIVE_ENCODER and HAS_SOUNDFILE else 'FFmpeg'}")
     logger.info(f"Output directory: {output_dir}")
-    logger.info(f"System: {os.name}, CPU cores: {os.cpu_count()}")
+    logger.info(f"System: {os.name}, CPU cores: {os.cpu_count()} ({get_available_cores()} available)")
     
     try:
         # Find WAV files
         logger.info("Scanning for WAV files...")
-        wav_files = find_wav_files(input_dir)
+        wav_files = find_wav_files(input_dir)  # (path, size) pairs
         
         if not wav_files:
             message = f"No WAV files found in '{input_dir}' or its subdirectories"
@@ -960,29 +1929,54 @@ def main() -> None:
         logger.info(f"Found {len(wav_files)} WAV file(s) to convert")
         print(f"Found {len(wav_files)} WAV file(s) to convert")
         
-        # Log each file found (but don't print to console)
-        for wav_file in wav_files:
-            relative_path = wav_file.relative_to(input_dir)
-            logger.debug(f"Found: {relative_path} ({wav_file.stat().st_size:,} bytes)")
+        # Log each file found (but don't print to console) - only walk the list if DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            for wav_file, file_size in wav_files:
+                logger.debug("Found: %s (%s bytes)", wav_file.relative_to(input_dir), f"{file_size:,}")
+
+        # Skip files converted by an earlier (possibly interrupted) run
+        if not args.force:
+            found_count = len(wav_files)
+            wav_files = skip_converted_files(wav_files, input_dir, output_dir, logger)
+            skipped_count = found_count - len(wav_files)
+
+            if skipped_count:
+                message = f"Skipping {skipped_count} file(s) that are already converted (use --force to re-convert)"
+                print(message)
+                logger.info(message)
+
+            if not wav_files:
+                message = "All WAV files are already converted - nothing to do"
+                print(f"\n{message}")
+                logger.info(message)
+                return
+
+        total_size_bytes = sum(file_size for _, file_size in wav_files)
         
         # Check caching requirements if enabled (but don't copy files yet)
-        if use_cache:
+        if cache_dir:
             # Check if cache directory has enough space
-            if not check_cache_disk_space(wav_files, cache_dir, logger):
+            if not check_cache_disk_space(total_size_bytes, cache_dir, logger, interactive=not args.no_prompt):
                 print("\nCannot proceed due to insufficient disk space for caching.")
                 return
             print("Cache disk space check passed.")
         
         # Confirm before proceeding (before any file copying)
         files_to_convert = len(wav_files)
-        total_size_mb = sum(f.stat().st_size for f in wav_files) / (1024 * 1024)
+        total_size_mb = total_size_bytes / (1024 * 1024)
 
         print(f"\nReady to convert {files_to_convert} files ({total_size_mb:.1f} MB) using:")
         print(f"• {thread_count} parallel conversions")
         print(f"• {ffmpeg_threads} thread(s) per FFmpeg process")
         print(f"• FLAC compression level {compression_level}")
+        if args.flac_block_size is not None or args.lpc_type is not None:
+            print(f"• FLAC block size {args.flac_block_size or 'default'}, LPC type {args.lpc_type or 'default'}")
+        if USE_NATIVE_ENCODER and HAS_SOUNDFILE:
+            print(f"• In-process libsndfile encoder (FFmpeg fallback for unsupported files)")
         
-        if use_cache:
+        if stream_input:
+            print(f"• Streaming input files directly into FFmpeg (no local cache)")
+        elif use_cache:
             print(f"• Local caching enabled")
             print(f"  - Temporary cache location: {cache_dir}")
             print(f"  - Cache will be automatically deleted after conversion")
@@ -994,7 +1988,7 @@ def main() -> None:
             print(f"  - Files batch-moved every {OUTPUT_CACHE_BATCH_SIZE} conversions")
             print(f"  - Dramatically reduces disk I/O bottleneck")
 
-        confirm = input("\nProceed? (y/N): ").strip().lower()
+        confirm = 'y' if args.no_prompt else input("\nProceed? (y/N): ").strip().lower()
         
         if confirm not in ['y', 'yes']:
             message = "Conversion cancelled by user"
@@ -1002,23 +1996,6 @@ def main() -> None:
             logger.info(message)
             return
         
-        # Now handle caching after user confirmation
-        cached_wav_files = wav_files
-        original_input_for_conversion = input_dir  # Keep reference for relative path calculations
-        
-        if use_cache:
-            print(f"\nCopying {len(wav_files)} files to local cache...")
-            print("This may take a few minutes depending on file sizes and network speed.")
-            cached_wav_files, failed_copies = copy_files_to_cache(wav_files, input_dir, cache_dir, logger)
-            
-            if not cached_wav_files:
-                print("No files could be cached. Cannot proceed.")
-                return
-            
-            # Update to use cached files for conversion
-            wav_files = cached_wav_files
-            input_dir = cache_dir  # This is where we'll read from
-
         # Create fast output cache if enabled
         actual_output_dir = output_dir  # Save the final destination
         if use_fast_output:
@@ -1027,93 +2004,87 @@ def main() -> None:
 
         # Pre-create all output directories to optimize performance
         print(f"\nOptimizing output directory structure...")
-        precreate_output_directories(wav_files, input_dir, output_dir, logger)
+        jobs = create_conversion_jobs(wav_files, input_dir, output_dir)
+        precreate_output_directories(jobs, logger)
+
+        # Longest files first (LPT scheduling): the biggest encodes start immediately and the
+        # small ones fill the gaps at the end, instead of one huge file finishing alone
+        jobs.sort(key=lambda job: job.input_size, reverse=True)
 
         # Start conversion
         print(f"\nStarting optimized conversion...")
+        if cache_dir:
+            print("Files are copied to the local cache and converted as they arrive.")
         print("-" * 50)
         logger.info("Starting optimized conversion process...")
         
         start_time = time.time()
         successful_conversions = 0
         failed_conversions = 0
-        converted_files = []  # Track successfully converted files
         failed_files = []     # Track failed files
-        total_input_size = 0
-        total_output_size = 0
+        converted_sizes = []  # (input_size, output_size) per converted file, summed after the run
 
         # Track temp files for batch moving
         temp_files_to_move = []
 
-        # Calculate total size for progress tracking
-        total_input_size_initial = sum(f.stat().st_size for f in wav_files)
-        logger.info(f"Total input size: {total_input_size_initial:,} bytes ({total_input_size_initial/1024/1024:.1f} MB)")
-
-        # Use ThreadPoolExecutor with user-specified thread count
-        # Process files in batches to prevent resource exhaustion
-        with ThreadPoolExecutor(max_workers=thread_count) as executor:
-            logger.info(f"Thread pool created with {thread_count} workers")
-            logger.info(f"Processing files in batches of {TASK_SUBMISSION_BATCH_SIZE} to prevent resource exhaustion")
+        logger.info(f"Total input size: {total_size_bytes:,} bytes ({total_size_mb:.1f} MB)")
+
+        # Use a process pool with user-specified worker count: every worker has its own GIL,
+        # so Python-side work (and in-process encoding) runs truly in parallel
+        worker_context = get_worker_context()
+        with ProcessPoolExecutor(max_workers=thread_count,
+                                 mp_context=worker_context,
+                                 initializer=init_conversion_worker,
+                                 initargs=(log_listener.queue, worker_context.Value('i', 0),
+                                           ffmpeg_threads)) as executor:
+            logger.info(f"Process pool created with {thread_count} workers ({worker_context.get_start_method()})")
+
+            if cache_dir:
+                # Copy and convert concurrently, deleting cached files as they are converted
+                results = iter_cached_conversion_results(executor, jobs, input_dir, cache_dir, ffmpeg_threads,
+                                                         flac_settings, thread_count, logger)
+            else:
+                # Group small files so one FFmpeg process converts several of them
+                file_batches = group_files_for_ffmpeg(jobs, thread_count)
+                logger.info(f"Grouped {len(jobs)} files into {len(file_batches)} FFmpeg invocations")
+                results = iter_conversion_results(executor, file_batches, ffmpeg_threads, flac_settings,
+                                                  thread_count, logger, pipe_input=stream_input)
 
-            # Process files in batches
             total_files = len(wav_files)
             files_processed = 0
+            conversion_progress = ProgressReporter(total_files, "Converted")
+
+            for success, relative_path, message, input_size, output_size, duration in results:
+                files_processed += 1
+
+                if success:
+                    successful_conversions += 1
+                    converted_sizes.append((input_size, output_size))
 
-            for batch_start in range(0, total_files, TASK_SUBMISSION_BATCH_SIZE):
-                batch_end = min(batch_start + TASK_SUBMISSION_BATCH_SIZE, total_files)
-                batch_files = wav_files[batch_start:batch_end]
-
-                logger.info(f"Submitting batch {batch_start//TASK_SUBMISSION_BATCH_SIZE + 1}: files {batch_start+1} to {batch_end}")
-
-                # Submit batch of conversion tasks
-                future_to_file = {
-                    executor.submit(convert_wav_to_flac_ffmpeg, wav_file, input_dir, output_dir,
-                                  ffmpeg_threads, compression_level, logger,
-                                  original_input_for_conversion if use_cache else None): wav_file
-                    for wav_file in batch_files
-                }
-
-                # Process completed tasks in this batch
-                for future in as_completed(future_to_file):
-                    files_processed += 1
-                    success, relative_path, message, input_size, output_size, duration = future.result()
-
-                    if success:
-                        successful_conversions += 1
-                        converted_files.append(relative_path)
-                        total_input_size += input_size
-                        total_output_size += output_size
-
-                        # Track temp file for batch moving
-                        if use_fast_output:
-                            output_filename = Path(relative_path).stem + ".flac"
-                            temp_file = output_dir / Path(relative_path).parent / output_filename
-                            temp_files_to_move.append(temp_file)
-
-                        # Optionally move files during conversion (every N files) or all at end
-                        if MOVE_FILES_DURING_CONVERSION and use_fast_output and len(temp_files_to_move) >= OUTPUT_CACHE_BATCH_SIZE:
-                            batch_move_files(temp_files_to_move, temp_output_dir, actual_output_dir)
-                            temp_files_to_move.clear()
-
-                        # Show progress every N files or for small batches
-                        if files_processed % PROGRESS_REPORT_INTERVAL_SMALL == 0 or total_files <= CONVERSION_PROGRESS_THRESHOLD:
-                            print(f"Converted {files_processed}/{total_files} files...")
-                            sys.stdout.flush()
-
-                    else:
-                        failed_conversions += 1
-                        failed_files.append((relative_path, message))
-                        print(f"({files_processed}/{total_files}) {relative_path}: {message}")
-                        sys.stdout.flush()
-
-                    # Explicitly delete future to free resources
-                    del future
-
-                # Clear the batch dictionary to free memory
-                future_to_file.clear()
-                del future_to_file
-
-                logger.info(f"Completed batch {batch_start//TASK_SUBMISSION_BATCH_SIZE + 1}: {files_processed}/{total_files} files processed")
+                    # Track temp file for batch moving
+                    if use_fast_output:
+                        output_filename = Path(relative_path).stem + ".flac"
+                        temp_file = output_dir / Path(relative_path).parent / output_filename
+                        temp_files_to_move.append(temp_file)
+
+                    # Optionally move files during conversion (every N files) or all at end
+                    if MOVE_FILES_DURING_CONVERSION and use_fast_output and len(temp_files_to_move) >= OUTPUT_CACHE_BATCH_SIZE:
+                        batch_move_files(temp_files_to_move, temp_output_dir, actual_output_dir, logger)
+                        temp_files_to_move.clear()
+
+                else:
+                    failed_conversions += 1
+                    failed_files.append((relative_path, message))
+                    conversion_progress.write(f"({files_processed}/{total_files}) {relative_path}: {message}")
+
+                # Progress output is throttled, so this is cheap even for thousands of tiny files
+                conversion_progress.update()
+
+            conversion_progress.close()
+            logger.info(f"All tasks completed: {files_processed}/{total_files} files processed")
+
+        total_input_size = sum(sizes[0] for sizes in converted_sizes)
+        total_output_size = sum(sizes[1] for sizes in converted_sizes)
 
         # Move ALL files at the end (not during conversion to avoid disk I/O interference)
         if use_fast_output and temp_files_to_move:
@@ -1132,14 +2103,17 @@ def main() -> None:
         if failed_conversions > 0:
             print(f"Failed conversions: {failed_conversions}")
         
+        # Computed once, shared by the console and log summaries
         if successful_conversions > 0:
-            avg_time = total_time / successful_conversions
-            total_compression = ((total_input_size - total_output_size) / total_input_size * 100) if total_input_size > 0 else 0
-            throughput_mbps = (total_input_size / total_time / (1024 * 1024)) if total_time > 0 else 0
+            stats = {
+                'avg_time': total_time / successful_conversions,
+                'compression': ((total_input_size - total_output_size) / total_input_size * 100) if total_input_size > 0 else 0,
+                'throughput_mbps': (total_input_size / total_time / (1024 * 1024)) if total_time > 0 else 0,
+            }
             
-            print(f"Average time per file: {avg_time:.2f} seconds")
-            print(f"Overall compression: {total_compression:.1f}%")
-            print(f"Throughput: {throughput_mbps:.1f} MB/s")
+            print(f"Average time per file: {stats['avg_time']:.2f} seconds")
+            print(f"Overall compression: {stats['compression']:.1f}%")
+            print(f"Throughput: {stats['throughput_mbps']:.1f} MB/s")
         
         print(f"Output directory: {output_dir}")
         print(f"Log file: {log_path}")
@@ -1158,15 +2132,11 @@ def main() -> None:
         logger.info(f"Success rate: {(successful_conversions/len(wav_files)*100):.1f}%")
         
         if successful_conversions > 0:
-            avg_time_per_file = total_time / successful_conversions
-            total_compression = ((total_input_size - total_output_size) / total_input_size * 100) if total_input_size > 0 else 0
-            throughput_mbps = (total_input_size / total_time / (1024 * 1024)) if total_time > 0 else 0
-            
-            logger.info(f"Average time per file: {avg_time_per_file:.2f} seconds")
+            logger.info(f"Average time per file: {stats['avg_time']:.2f} seconds")
             logger.info(f"Total input size: {total_input_size:,} bytes")
             logger.info(f"Total output size: {total_output_size:,} bytes")
-            logger.info(f"Overall compression: {total_compression:.1f}%")
-            logger.info(f"Throughput: {throughput_mbps:.1f} MB/s")
+            logger.info(f"Overall compression: {stats['compression']:.1f}%")
+            logger.info(f"Throughput: {stats['throughput_mbps']:.1f} MB/s")
         
         logger.info("="*80)
         logger.info("OPTIMIZED WAV to FLAC Conversion Log Completed")
@@ -1181,7 +2151,11 @@ def main() -> None:
         if temp_output_dir and temp_output_dir.exists():
             cleanup_output_cache(temp_output_dir, logger if 'logger' in locals() else None)
 
+        # Write out any log records still queued
+        stop_log_listener(log_listener)
+
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Required for process pools in frozen Windows executables
     try:
         main()
     except KeyboardInterrupt:
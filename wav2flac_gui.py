@@ -18,29 +18,43 @@ Author: Audio conversion utility
 
 import os
 import sys
+import itertools
+import functools
+import asyncio
+import types
 import logging
+import logging.handlers
+import multiprocessing
 import subprocess
 import shutil
+import ctypes
+import errno
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import time
 from datetime import datetime
 import threading
 import queue
+import collections
 import zipfile
 import urllib.request
 import urllib.error
 import platform
 import ssl
 import json
-import webbrowser
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import tkinter.font as tkfont
 
+@functools.lru_cache(maxsize=None)
 def create_ssl_context():
-    """Create SSL context using certifi + Windows certificate store"""
+    """
+    Create SSL context using certifi + Windows certificate store
+
+    Built once and shared by the update check and the FFmpeg download (loading the
+    certificate stores is slow, and an SSLContext can be used from several threads).
+    """
     try:
         import certifi
         ctx = ssl.create_default_context(cafile=certifi.where())
@@ -60,16 +74,49 @@ try:
 except ImportError:
     HAS_PACKAGING = False
 
+# Try to import soundfile (libsndfile) for in-process FLAC encoding, FFmpeg is used if not available
+try:
+    import numpy as np
+    import soundfile as sf
+    HAS_SOUNDFILE = True
+except ImportError:
+    HAS_SOUNDFILE = False
+
+# Module logger, shared by the conversion helpers, the file log (setup_file_logging) and main()
+logger = logging.getLogger(__name__)
+
 # Application version and update checking
 APP_VERSION = "1.0.4"
 
 # Update checking configuration for GitHub repository: lainalex/wav2flac
 UPDATE_CHECK_URL = "https://api.github.com/repos/lainalex/wav2flac/releases/latest"
+UPDATE_REMIND_LATER_SECONDS = 24 * 60 * 60  # "Remind Later" skips update checks for a day
 
 # Configuration constants
+FFMPEG_INSTALLED_FILES = ('ffmpeg.exe', 'ffprobe.exe')  # Only these are taken from the FFmpeg zip's bin folder (ffplay is never used)
+DOWNLOAD_BLOCK_SIZE = 1 << 20  # 1 MiB reads when downloading FFmpeg (also the progress update step)
+DOWNLOAD_RANGES = 8  # FFmpeg zip is fetched as this many HTTP byte ranges when the server supports them
+DOWNLOAD_THREADS = 4  # Byte ranges downloaded in parallel (per-connection speed caps no longer limit the whole download)
+DOWNLOAD_MIN_RANGED_SIZE = 16 * 1024 * 1024  # Smaller downloads use a single connection
 CACHE_COPY_THREADS = 8  # Maximum threads for I/O-bound cache copying
+CACHE_PREFETCH_PER_THREAD = 2  # Copied-but-unconverted files allowed per copy thread (backpressure for the copy/encode pipeline)
 DISK_SPACE_SAFETY_MARGIN = 1.2  # 20% extra space required for caching
 INPUT_CACHE_BATCH_SIZE = 2000  # For hybrid batch caching: cache and convert N files at a time (allows full CPU utilization with limited cache space)
+LOG_MAX_LINES = 5000  # Log window keeps at most this many lines (the oldest half is dropped; the log file keeps everything)
+QUEUE_SAFETY_POLL_MS = 500  # Fallback poll for log/progress updates; normally they are drained on a <<QueueUpdate>> event
+FFMPEG_TIMEOUT_SECONDS = 300  # 5 minute timeout per file
+FFMPEG_STDERR_TAIL_LINES = 32  # Last FFmpeg stderr lines kept for the error message (stderr is streamed, not buffered whole)
+FFMPEG_MAX_THREADS = 2  # FFmpeg's FLAC encoder gains nothing from more threads per process; more files in parallel scale better
+FFMPEG_BATCH_SIZE = 16  # Maximum small WAV files encoded by a single FFmpeg process (amortizes process startup)
+FFMPEG_BATCH_MAX_BYTES = 64 * 1024 * 1024  # Files at or above this size get their own FFmpeg process
+OUTPUT_MTIME_TOLERANCE_SECONDS = 2  # FAT/exFAT and some network shares store modification times with 2 s precision
+INFLIGHT_TASKS_PER_WORKER = 2  # Conversions submitted ahead per worker process (keeps workers busy without queuing every file up front)
+
+# In-process encoder configuration (requires the optional 'soundfile' package, version 0.12+)
+USE_NATIVE_ENCODER = False  # Encode with libsndfile instead of FFmpeg (no process per file, but BWF/bext fields are not copied)
+NATIVE_BLOCK_FRAMES = 1 << 16  # Frames read and encoded per block by the in-process encoder
+NATIVE_FLAC_SUBTYPES = {'PCM_U8': 'PCM_S8', 'PCM_S8': 'PCM_S8', 'PCM_16': 'PCM_16', 'PCM_24': 'PCM_24'}  # WAV subtype -> FLAC subtype
+NATIVE_COPIED_TAGS = ('title', 'copyright', 'software', 'artist', 'comment', 'date', 'album', 'license', 'tracknumber', 'genre')
 
 # To disable update checking completely, uncomment the line below:
 # UPDATE_CHECK_URL = None (test)
@@ -84,6 +131,481 @@ APP_METADATA = {
     "legitimate": True
 }
 
+def copy_file_to_cache(source, destination):
+    """
+    Copy a file with its timestamps, using the operating system's own copy routine
+
+    On Windows this is CopyFileExW, which copies in large chunks and lets SMB servers
+    do the copy server-side. On Linux copy_file_range() keeps the data in the kernel and lets
+    NFS 4.2/CIFS servers and reflink filesystems copy without moving bytes through this process;
+    elsewhere (or where it is unsupported) shutil.copy2 uses sendfile/fcopyfile.
+    """
+    if sys.platform == "win32":
+        if not ctypes.windll.kernel32.CopyFileExW(str(source), str(destination), None, None, None, 0):
+            raise ctypes.WinError()
+        return
+
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source, 'rb', buffering=0) as src, open(destination, 'wb', buffering=0) as dst:
+                while os.copy_file_range(src.fileno(), dst.fileno(), 1 << 30):
+                    pass
+            shutil.copystat(source, destination)
+            return
+        except OSError as e:
+            # Not supported for this pair of filesystems (EXDEV, ENOSYS, EOPNOTSUPP, ...) - use shutil
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL, errno.EPERM):
+                raise
+
+    shutil.copy2(source, destination)
+
+def usable_cpu_count():
+    """
+    Number of CPUs this process may actually run on
+
+    Unlike os.cpu_count() this honours CPU affinity masks and cpusets (containers, 'start /affinity',
+    taskset), so conversions aren't planned for cores the process can't use.
+    """
+    if hasattr(os, 'process_cpu_count'):  # Python 3.13+
+        return os.process_cpu_count() or 1
+    if hasattr(os, 'sched_getaffinity'):  # Linux
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def iter_wav_files(directory):
+    """Recursively yield (path, size) for WAV files (any extension case) below a directory using a single os.scandir() pass"""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_wav_files(entry.path)
+                elif entry.name.lower().endswith('.wav'):
+                    # DirEntry caches stat data (free on Windows), so sizes never need a second pass
+                    try:
+                        file_size = entry.stat().st_size
+                    except OSError:
+                        file_size = 0  # Keep the file - its conversion will report the error
+                    yield Path(entry.path), file_size
+    except OSError:
+        # Unreadable directory (permissions, vanished share) - skip it like rglob() did
+        return
+
+@functools.lru_cache(maxsize=128)
+def parse_version(version_string):
+    """
+    Parse a version string into something comparable, caching the result
+
+    Uses packaging when available; otherwise returns a tuple of ints with trailing zeros
+    dropped, so "1.0" and "1.0.0" compare equal. Raises ValueError (or packaging's
+    InvalidVersion) for strings that can't be parsed.
+    """
+    if HAS_PACKAGING:
+        return version.parse(version_string)
+    return parse_version_parts(version_string)
+
+@functools.lru_cache(maxsize=128)
+def parse_version_parts(version_string):
+    """Parse a dotted numeric version string into a tuple of ints (trailing zeros dropped)"""
+    parts = [int(x) for x in version_string.split('.')]
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+@functools.lru_cache(maxsize=None)
+def get_subprocess_config():
+    """
+    Configure subprocess to run quietly on Windows
+
+    Built once per process and reused for every FFmpeg call; subprocess copies STARTUPINFO
+    before launching, so sharing one instance is safe.
+    """
+    startupinfo = None
+    creation_flags = 0
+
+    if sys.platform == "win32":
+        # Configure Windows subprocess to hide console windows
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+        creation_flags = subprocess.CREATE_NO_WINDOW
+
+    return startupinfo, creation_flags
+
+@functools.lru_cache(maxsize=None)
+def probe_ffmpeg(ffmpeg_path):
+    """
+    Check that an FFmpeg executable runs and can encode FLAC, with a single '-encoders' run
+
+    The encoder list goes to stdout and the banner ("ffmpeg version N ...") to stderr, so one
+    process answers both questions. Cached for the session, since the answer does not change
+    between Start clicks; verify_ffmpeg_installation() clears the cache after (re)installing FFmpeg.
+
+    Returns:
+        tuple: (version string or None if FFmpeg did not run, whether FLAC encoding is supported)
+    """
+    startupinfo, creation_flags = get_subprocess_config()
+
+    try:
+        # Output stays bytes: only the banner's first line is ever decoded
+        result = subprocess.run([ffmpeg_path, '-encoders'], capture_output=True, timeout=10,
+                                startupinfo=startupinfo, creationflags=creation_flags,
+                                stdin=subprocess.DEVNULL)
+    except (subprocess.TimeoutExpired, OSError):
+        return None, False
+    if result.returncode != 0:
+        return None, False
+
+    version_line = result.stderr[:256].split(b'\n', 1)[0].decode('ascii', 'replace').split()
+    if len(version_line) > 2 and version_line[1] == 'version':
+        ffmpeg_version = version_line[2]
+    else:
+        ffmpeg_version = "unknown version"
+    return ffmpeg_version, b' flac ' in result.stdout.lower()
+
+def encode_flac_native(wav_path, output_file_path, relative_path, compression_level):
+    """
+    Encode a WAV file to FLAC in-process with libsndfile (no FFmpeg process)
+
+    Audio is streamed through one reusable block buffer, so memory use does not depend on file size.
+    Standard text tags are copied; BWF (bext) fields are not, which is why FFmpeg stays the default.
+
+    Returns:
+        bool: True if the FLAC file was written, False if FFmpeg should convert this file instead
+    """
+    try:
+        with sf.SoundFile(str(wav_path), 'r') as infile:
+            output_subtype = NATIVE_FLAC_SUBTYPES.get(infile.subtype)
+            if output_subtype is None:
+                # FLAC cannot store 32-bit or floating point samples losslessly - let FFmpeg decide
+                return False
+
+            with sf.SoundFile(str(output_file_path), 'w',
+                              samplerate=infile.samplerate,
+                              channels=infile.channels,
+                              format='FLAC',
+                              subtype=output_subtype,
+                              compression_level=compression_level / 12) as outfile:
+                # Text tags must be written before any audio data
+                for tag in NATIVE_COPIED_TAGS:
+                    value = getattr(infile, tag)
+                    if value:
+                        setattr(outfile, tag, value)
+
+                # Reuse one buffer for the whole file instead of allocating per block
+                buffer = np.empty((NATIVE_BLOCK_FRAMES, infile.channels), dtype='int32')
+                while True:
+                    frames = infile.read(out=buffer)
+                    if not len(frames):
+                        break
+                    outfile.write(frames)
+        return True
+
+    except Exception as e:
+        logger.warning("%s: In-process encoding failed (%s), using FFmpeg", relative_path, e)
+        return False
+
+def build_ffmpeg_args(ffmpeg_path, ffmpeg_threads, compression_level):
+    """
+    Build the fixed parts of the FFmpeg command once per conversion run
+
+    Returns:
+        tuple: (global arguments, per-output encoder arguments) for build_ffmpeg_command()
+    """
+    global_args = (
+        str(ffmpeg_path),
+        '-y',                                   # Overwrite output files
+        '-v', 'error',                          # Only show errors (reduces overhead)
+        '-nostdin',                             # Don't read from stdin (prevents hanging)
+    )
+    output_args = (
+        '-threads', str(ffmpeg_threads),        # Thread count (calculated to avoid oversubscription)
+        '-c:a', 'flac',                         # Audio codec: FLAC
+        '-compression_level', str(compression_level), # FLAC compression (0=fast, 12=best)
+        '-write_bext', '1',                     # Preserve Broadcast Wave Format (BWF) metadata
+    )
+    return global_args, output_args
+
+def build_ffmpeg_command(ffmpeg_args, file_pairs):
+    """
+    Build an FFmpeg command converting each (wav_path, output_file_path) pair
+
+    Several pairs share one FFmpeg process: every input gets its own '-i' and every output
+    its own '-map N:a ... output.flac' section, so startup and codec setup are paid once.
+    """
+    global_args, output_args = ffmpeg_args
+    ffmpeg_cmd = list(global_args)
+    for wav_path, _ in file_pairs:
+        ffmpeg_cmd += ['-f', 'wav', '-i', str(wav_path)]  # Input is always WAV/RF64 - skip format probing
+    for index, (_, output_file_path) in enumerate(file_pairs):
+        ffmpeg_cmd += [
+            '-map', f'{index}:a',               # Audio of input N only
+            '-map_metadata', str(index),        # Copy all metadata from input N
+            *output_args,
+            str(output_file_path)
+        ]
+    return ffmpeg_cmd
+
+def iter_ffmpeg_batches(tasks, batch_limit, keep_running=lambda: True):
+    """
+    Group conversion tasks into FFmpeg batches for convert_batch_async()
+
+    Small files are packed together (up to batch_limit per batch) because FFmpeg startup
+    dominates their conversion time; files of FFMPEG_BATCH_MAX_BYTES or more get a batch of
+    their own, so one slow file doesn't hold up the small ones. When the tasks run out because
+    the conversion was stopped (keep_running() returns False), the partial batch is dropped.
+    """
+    current_batch = []
+    for task in tasks:
+        if task[4] >= FFMPEG_BATCH_MAX_BYTES:
+            yield [task]
+            continue
+
+        current_batch.append(task)
+        if len(current_batch) >= batch_limit:
+            yield current_batch
+            current_batch = []
+
+    if current_batch and keep_running():
+        yield current_batch
+
+def is_output_up_to_date(source_path, output_path):
+    """
+    Check whether a WAV file's FLAC was written by a completed conversion
+
+    finish_conversion() gives every finished FLAC its WAV's modification time, so a matching
+    time means the FLAC is complete and the WAV hasn't changed since. A FLAC left behind by
+    an interrupted conversion has the time it was written and is converted again.
+    """
+    try:
+        output_stat = output_path.stat()
+    except OSError:
+        return False
+    if output_stat.st_size == 0:
+        return False
+    try:
+        source_mtime = source_path.stat().st_mtime
+    except OSError:
+        return False
+    return abs(output_stat.st_mtime - source_mtime) <= OUTPUT_MTIME_TOLERANCE_SECONDS
+
+def finish_conversion(relative_path, output_file_path, original_wav_path, input_size, returncode, stderr_output, duration):
+    """Check an encoder's outcome, copy the WAV timestamps onto the FLAC and build the result tuple"""
+    if returncode != 0:
+        # Error message format like original script
+        error_msg = f"FFmpeg error (code {returncode}): {stderr_output.strip()}"
+        return False, str(relative_path), error_msg, input_size, 0
+
+    # Get output file size (like original); a single stat() also checks that the file exists
+    try:
+        output_size = output_file_path.stat().st_size
+    except FileNotFoundError:
+        error_msg = "FFmpeg completed but output file not found"
+        return False, str(relative_path), error_msg, input_size, 0
+    except OSError as e:
+        error_msg = f"FFmpeg completed but output file can't be read: {e}"
+        return False, str(relative_path), error_msg, input_size, 0
+
+    compression_ratio = (1 - output_size / input_size) * 100 if input_size > 0 else 0
+
+    # Preserve file timestamps from original WAV to output FLAC
+    # (when caching, original_wav_path is the file on the source drive, not the cached copy)
+    try:
+        # Get timestamps from original WAV file
+        stat_info = original_wav_path.stat()
+        # Copy modification time and access time to FLAC file
+        os.utime(output_file_path, (stat_info.st_atime, stat_info.st_mtime))
+    except (OSError, IOError) as e:
+        logger.warning("%s: Could not preserve file timestamps: %s", relative_path, e)
+
+    # Message format exactly like original script
+    message = f"Converted to {output_file_path.name} ({compression_ratio:.1f}% smaller, {duration:.2f}s)"
+    return True, str(relative_path), message, input_size, output_size
+
+def convert_single_file(wav_path, relative_path, output_file_path, original_wav_path, input_size, ffmpeg_args, compression_level):
+    """
+    Convert a single WAV file to FLAC (with proper background processing)
+
+    Runs in a conversion worker process, so it is a module-level function that only takes
+    picklable arguments (no Tk variables or GUI state). ffmpeg_args comes from build_ffmpeg_args();
+    the relative and output paths are planned once per run by conversion_worker(), the output
+    directories already exist and input_size comes from the directory scan.
+    """
+    start_time = time.time()
+
+    try:
+        # Encode in-process if enabled; FFmpeg handles everything libsndfile can't
+        if USE_NATIVE_ENCODER and HAS_SOUNDFILE and encode_flac_native(wav_path, output_file_path, relative_path, compression_level):
+            returncode, stderr_output = 0, ""
+        else:
+            # Only the two paths change per file; the rest of the command is prebuilt once per run
+            ffmpeg_cmd = build_ffmpeg_command(ffmpeg_args, [(wav_path, output_file_path)])
+
+            # Get subprocess configuration for background execution (cached per worker process)
+            startupinfo, creation_flags = get_subprocess_config()
+
+            # Run FFmpeg conversion in complete background
+            process = subprocess.Popen(
+                ffmpeg_cmd,
+                stdout=subprocess.DEVNULL,  # Nothing is written to stdout with '-v error'; only stderr is read
+                stderr=subprocess.PIPE,
+                text=True,
+                errors='replace',
+                startupinfo=startupinfo,
+                creationflags=creation_flags,
+                stdin=subprocess.DEVNULL  # Ensure no stdin interaction
+            )
+
+            # Stream stderr and keep only its tail; the timer kills FFmpeg if it hangs
+            # (select() can't wait on pipes on Windows, so the timeout can't live in the read loop)
+            timeout_timer = threading.Timer(FFMPEG_TIMEOUT_SECONDS, process.kill)
+            timeout_timer.start()
+            try:
+                with process.stderr:
+                    stderr_tail = collections.deque(process.stderr, maxlen=FFMPEG_STDERR_TAIL_LINES)
+                returncode = process.wait()
+            finally:
+                timeout_timer.cancel()
+
+            if returncode != 0 and time.time() - start_time >= FFMPEG_TIMEOUT_SECONDS:
+                raise subprocess.TimeoutExpired(ffmpeg_cmd, FFMPEG_TIMEOUT_SECONDS)
+            stderr_output = ''.join(stderr_tail)
+
+        return finish_conversion(relative_path, output_file_path, original_wav_path, input_size,
+                                 returncode, stderr_output, time.time() - start_time)
+
+    except subprocess.TimeoutExpired:
+        error_msg = "Conversion timed out (>5 minutes)"
+        return False, str(relative_path), error_msg, input_size, 0
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+        return False, str(relative_path), error_msg, input_size, 0
+
+async def wait_for_ffmpeg(process, timeout):
+    """
+    Wait for an FFmpeg process started with stderr=PIPE, reading its stderr as it is written
+
+    Only the last FFMPEG_STDERR_TAIL_LINES lines are kept, so a chatty FFmpeg build can't
+    pile up output in memory. The process is killed if it runs longer than timeout seconds.
+
+    Returns:
+        str: The kept stderr lines (raises asyncio.TimeoutError on timeout)
+    """
+    stderr_tail = collections.deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+
+    async def read_stderr():
+        async for line in process.stderr:
+            stderr_tail.append(line.decode(errors='replace'))
+        await process.wait()
+
+    try:
+        await asyncio.wait_for(read_stderr(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+
+    return ''.join(stderr_tail)
+
+async def convert_single_file_async(wav_path, relative_path, output_file_path, original_wav_path, input_size, ffmpeg_args, compression_level):
+    """
+    Convert a single WAV file to FLAC with FFmpeg on an asyncio event loop
+
+    Same arguments and result as convert_single_file(); waiting for FFmpeg doesn't occupy a
+    thread or worker process, so one event loop drives every running conversion.
+    """
+    start_time = time.time()
+
+    try:
+        startupinfo, creation_flags = get_subprocess_config()
+
+        process = await asyncio.create_subprocess_exec(
+            *build_ffmpeg_command(ffmpeg_args, [(wav_path, output_file_path)]),
+            stdout=subprocess.DEVNULL,  # Nothing is written to stdout with '-v error'; only stderr is read
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,  # Ensure no stdin interaction
+            startupinfo=startupinfo,
+            creationflags=creation_flags
+        )
+        try:
+            stderr_output = await wait_for_ffmpeg(process, FFMPEG_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            error_msg = "Conversion timed out (>5 minutes)"
+            return False, str(relative_path), error_msg, input_size, 0
+
+        return finish_conversion(relative_path, output_file_path, original_wav_path, input_size,
+                                 process.returncode, stderr_output, time.time() - start_time)
+
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+        return False, str(relative_path), error_msg, input_size, 0
+
+async def convert_batch_async(tasks, ffmpeg_args, compression_level):
+    """
+    Convert a batch of WAV files with a single FFmpeg process (see iter_ffmpeg_batches())
+
+    If the batch fails for any reason the files are retried one by one, so a single bad
+    WAV only fails itself and still gets a precise error message.
+
+    Returns:
+        list: One convert_single_file() result per task
+    """
+    if len(tasks) == 1:
+        return [await convert_single_file_async(*tasks[0], ffmpeg_args, compression_level)]
+
+    start_time = time.time()
+
+    try:
+        startupinfo, creation_flags = get_subprocess_config()
+
+        process = await asyncio.create_subprocess_exec(
+            *build_ffmpeg_command(ffmpeg_args, [(task[0], task[2]) for task in tasks]),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            startupinfo=startupinfo,
+            creationflags=creation_flags
+        )
+        stderr_output = await wait_for_ffmpeg(process, FFMPEG_TIMEOUT_SECONDS * len(tasks))
+
+        if process.returncode != 0:
+            raise RuntimeError(f"FFmpeg error (code {process.returncode}): {stderr_output.strip()}")
+
+    except Exception as e:
+        logger.warning("Batch of %d files failed (%s); retrying files individually",
+                       len(tasks), 'timed out' if isinstance(e, asyncio.TimeoutError) else e)
+        return [await convert_single_file_async(*task, ffmpeg_args, compression_level) for task in tasks]
+
+    # Split the batch wall time evenly so per-file times stay meaningful
+    duration = (time.time() - start_time) / len(tasks)
+
+    return [finish_conversion(relative_path, output_file_path, original_wav_path, input_size, 0, "", duration)
+            for _, relative_path, output_file_path, original_wav_path, input_size in tasks]
+
+# Conversion options of the current run, set in each worker process by init_conversion_worker()
+WORKER_CONVERSION_OPTIONS = {}
+
+def init_conversion_worker(log_queue, conversion_options):
+    """
+    Initializer for conversion worker processes
+
+    Worker processes don't share the GUI's logging setup, so their records (e.g. timestamp
+    warnings) are sent back through log_queue and written to the log file by the GUI process.
+    The run's conversion options and the subprocess config are set up here once per worker,
+    so tasks only carry their file paths.
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+
+    WORKER_CONVERSION_OPTIONS.update(conversion_options)
+    get_subprocess_config()
+
+def convert_file_in_worker(wav_path, relative_path, output_file_path, original_wav_path, input_size):
+    """Process pool task: convert_single_file() with the options from init_conversion_worker()"""
+    return convert_single_file(wav_path, relative_path, output_file_path, original_wav_path, input_size,
+                               **WORKER_CONVERSION_OPTIONS)
+
 class WAVtoFLACConverter:
     def __init__(self, root):
         self.root = root
@@ -107,8 +629,9 @@ class WAVtoFLACConverter:
         self.use_cache = tk.BooleanVar()
         self.cache_dir = tk.StringVar()
         self.cache_batch_size = tk.IntVar(value=INPUT_CACHE_BATCH_SIZE)  # Batch size for hybrid caching
-        self.thread_count = tk.IntVar(value=max(1, (os.cpu_count() or 1) // 2))
+        self.thread_count = tk.IntVar(value=max(1, usable_cpu_count() // 2))
         self.compression_level = tk.IntVar(value=12)
+        self.skip_converted = tk.BooleanVar(value=True)  # Re-runs skip WAVs whose FLAC is up to date
 
         # Conversion state
         self.is_converting = False
@@ -116,6 +639,8 @@ class WAVtoFLACConverter:
         self.executor = None
         self.logger = None
         self.log_file_path = None
+        self.log_file_handler = None
+        self.log_listener = None
         
         # FFmpeg installation state
         self.is_installing_ffmpeg = False
@@ -126,26 +651,36 @@ class WAVtoFLACConverter:
         self.update_check_thread = None
         self.latest_version = None
         self.update_available = False
+        self.update_dialog = None  # Built on first use by build_update_dialog(), then hidden and reshown
+        self.latest_version_var = tk.StringVar()  # Shown by the update dialog
         
-        # Progress tracking
-        self.progress_queue = queue.Queue()
-        self.log_queue = queue.Queue()
+        # Progress tracking (deque append/popleft are atomic, so worker threads need no lock)
+        self.progress_queue = collections.deque()
+        # Bounded like the widget itself: if the UI falls behind, only the newest lines are ever inserted
+        self.log_queue = collections.deque(maxlen=LOG_MAX_LINES)
+        self.queue_update_pending = False  # Set while a <<QueueUpdate>> event is waiting to be handled
         
         # FFmpeg installation path
         self.ffmpeg_dir = Path.home() / ".wav_flac_converter" / "ffmpeg"
+
+        # "Skip Version" / "Remind Later" choices, kept across launches
+        self.update_state_file = Path.home() / ".wav_flac_converter" / "update_state.json"
+        self.update_state = self.load_update_state()
         
         # Create GUI
         self.create_widgets()
 
-        # Initialize CPU slider (cache disabled by default = 4 files at a time mode)
+        # Initialize CPU slider (cache disabled by default = up to 4 files at a time mode)
+        no_cache_conversions = min(4, usable_cpu_count())
         self.thread_scale.config(state='disabled')
-        self.thread_count.set(4)
-        self.cpu_limit_indicator.config(text="(4 files at a time)")
+        self.thread_count.set(no_cache_conversions)
+        self.cpu_limit_indicator.config(text=f"({no_cache_conversions} files at a time)")
 
         self.check_prerequisites()
 
-        # Start queue processing
-        self.process_queues()
+        # Start queue processing - drained when workers post updates, with a slow safety poll
+        self.root.bind('<<QueueUpdate>>', lambda event: self.process_queues())
+        self.poll_queues()
         
         # Check for updates in background
         self.start_update_check()
@@ -213,13 +748,13 @@ class WAVtoFLACConverter:
             icon_image = tk.PhotoImage(width=16, height=16)
             
             # Create a simple audio wave pattern
-            # Fill with a basic pattern (blue background with white wave)
-            for x in range(16):
-                for y in range(16):
-                    if y == 8 or (y == 7 and x % 4 == 0) or (y == 9 and x % 4 == 2):
-                        icon_image.put("white", (x, y))
-                    else:
-                        icon_image.put("#0078d4", (x, y))
+            # Fill with a basic pattern (blue background with white wave), uploaded with a single put()
+            rows = []
+            for y in range(16):
+                row = ["white" if y == 8 or (y == 7 and x % 4 == 0) or (y == 9 and x % 4 == 2) else "#0078d4"
+                       for x in range(16)]
+                rows.append("{" + " ".join(row) + "}")
+            icon_image.put(" ".join(rows))
             
             self.root.iconphoto(True, icon_image)
             
@@ -284,7 +819,7 @@ class WAVtoFLACConverter:
 
         thread_frame = ttk.Frame(settings_frame)
         thread_frame.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
-        self.thread_scale = ttk.Scale(thread_frame, from_=1, to=os.cpu_count() or 1, variable=self.thread_count,
+        self.thread_scale = ttk.Scale(thread_frame, from_=1, to=usable_cpu_count(), variable=self.thread_count,
                  orient=tk.HORIZONTAL, command=lambda v: self.thread_count.set(int(float(v))))
         self.thread_scale.grid(row=0, column=0, sticky=(tk.W, tk.E))
         thread_frame.columnconfigure(0, weight=1)
@@ -299,22 +834,26 @@ class WAVtoFLACConverter:
         comp_frame.columnconfigure(0, weight=1)
         ttk.Label(comp_frame, textvariable=self.compression_level).grid(row=0, column=1, padx=(5, 0))
 
+        # Incremental re-runs
+        ttk.Checkbutton(settings_frame, text="Skip files already converted (unchanged since their FLAC was written)",
+                       variable=self.skip_converted).grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+
         # Separator
-        ttk.Separator(settings_frame, orient='horizontal').grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
+        ttk.Separator(settings_frame, orient='horizontal').grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
 
         # Input caching (now part of Conversion Settings)
         ttk.Checkbutton(settings_frame, text="Cache input files to fast local drive (enables full CPU utilization)",
-                       variable=self.use_cache, command=self.toggle_cache).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
+                       variable=self.use_cache, command=self.toggle_cache).grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
 
         help_label = ttk.Label(settings_frame,
                               text="Copies WAV files to fast local storage before conversion. Recommended for network based files or file systems\n"
                                    "that utilize RAID. Default is 2000 files at a time.",
                               foreground="gray", font=('TkDefaultFont', 8))
-        help_label.grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
+        help_label.grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
 
-        ttk.Label(settings_frame, text="Cache Directory:").grid(row=5, column=0, sticky=tk.W, pady=2)
+        ttk.Label(settings_frame, text="Cache Directory:").grid(row=6, column=0, sticky=tk.W, pady=2)
         cache_dir_frame = ttk.Frame(settings_frame)
-        cache_dir_frame.grid(row=5, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
+        cache_dir_frame.grid(row=6, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
         cache_dir_frame.columnconfigure(0, weight=1)
         self.cache_entry = ttk.Entry(cache_dir_frame, textvariable=self.cache_dir, state='disabled')
         self.cache_entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
@@ -323,9 +862,9 @@ class WAVtoFLACConverter:
         self.cache_browse_btn.grid(row=0, column=1)
 
         # Batch size configuration
-        ttk.Label(settings_frame, text="Batch size:").grid(row=6, column=0, sticky=tk.W, pady=2)
+        ttk.Label(settings_frame, text="Batch size:").grid(row=7, column=0, sticky=tk.W, pady=2)
         batch_size_frame = ttk.Frame(settings_frame)
-        batch_size_frame.grid(row=6, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
+        batch_size_frame.grid(row=7, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
 
         self.batch_size_scale = ttk.Scale(batch_size_frame, from_=500, to=5000,
                                           variable=self.cache_batch_size, orient='horizontal', length=120,
@@ -338,7 +877,7 @@ class WAVtoFLACConverter:
         batch_help = ttk.Label(settings_frame,
                               text="Number of files to cache and convert per batch (500-5000 files). Adjust based on available cache space.",
                               foreground="gray", font=('TkDefaultFont', 8))
-        batch_help.grid(row=7, column=0, columnspan=2, sticky=tk.W, pady=(0, 0))
+        batch_help.grid(row=8, column=0, columnspan=2, sticky=tk.W, pady=(0, 0))
 
         # Progress section
         progress_frame = ttk.LabelFrame(main_frame, text="Progress", padding="10")
@@ -383,7 +922,7 @@ class WAVtoFLACConverter:
         
     def toggle_cache(self):
         """Enable/disable cache directory selection and adjust CPU slider"""
-        max_cores = os.cpu_count() or 1
+        max_cores = usable_cpu_count()
 
         if self.use_cache.get():
             # Caching enabled - allow parallel conversions with CPU selection
@@ -394,13 +933,14 @@ class WAVtoFLACConverter:
             # Automatically set to max cores when cache is enabled
             self.thread_count.set(max_cores)
         else:
-            # No caching - limited parallel mode (4 files at a time), CPU slider not applicable
+            # No caching - limited parallel mode (up to 4 files at a time), CPU slider not applicable
+            no_cache_conversions = min(4, max_cores)
             self.cache_entry.config(state='disabled')
             self.cache_browse_btn.config(state='disabled')
             self.thread_scale.config(state='disabled')
-            self.cpu_limit_indicator.config(text="(4 files at a time)")
-            # Set to 4 since we process 4 files concurrently in non-cached mode
-            self.thread_count.set(4)
+            self.cpu_limit_indicator.config(text=f"({no_cache_conversions} files at a time)")
+            # Matches the number of files converted concurrently in non-cached mode
+            self.thread_count.set(no_cache_conversions)
 
     def add_context_menu(self, entry_widget):
         """Add right-click context menu with Cut, Copy, Paste to an Entry widget"""
@@ -451,20 +991,6 @@ class WAVtoFLACConverter:
             cache_path = Path(directory)
             self.cache_dir.set(str(cache_path))
 
-    def get_subprocess_config(self):
-        """Configure subprocess to run quietly on Windows"""
-        startupinfo = None
-        creation_flags = 0
-        
-        if sys.platform == "win32":
-            # Configure Windows subprocess to hide console windows
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            creation_flags = subprocess.CREATE_NO_WINDOW
-        
-        return startupinfo, creation_flags
-            
     def check_prerequisites(self):
         """Check if FFmpeg is available"""
         self.log_message("Checking prerequisites...")
@@ -484,75 +1010,42 @@ class WAVtoFLACConverter:
         
     def check_ffmpeg_in_path(self):
         """Check if FFmpeg is available in system PATH (background execution)"""
-        try:
-            startupinfo, creation_flags = self.get_subprocess_config()
-            
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=10,
-                                  startupinfo=startupinfo, 
-                                  creationflags=creation_flags,
-                                  stdin=subprocess.DEVNULL)
-            if result.returncode == 0:
-                version_line = result.stdout.split('\n')[0]
-                self.log_message(f"FFmpeg found in PATH: {version_line.split()[2]}")
-                
-                # Test FLAC encoding
-                if self.check_flac_support('ffmpeg'):
-                    self.install_ffmpeg_btn.config(text="Reinstall FFmpeg")
-                    return True
-                    
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        ffmpeg_version, flac_supported = probe_ffmpeg('ffmpeg')
+        if ffmpeg_version is None:
+            return False
+
+        self.log_message(f"FFmpeg found in PATH: {ffmpeg_version}")
+
+        # Test FLAC encoding
+        if self.check_flac_support(flac_supported):
+            self.install_ffmpeg_btn.config(text="Reinstall FFmpeg")
+            return True
         return False
         
     def check_local_ffmpeg(self):
         """Check if we have a local FFmpeg installation (background execution)"""
         local_ffmpeg = self.ffmpeg_dir / "bin" / "ffmpeg.exe"
-        if local_ffmpeg.exists():
-            try:
-                startupinfo, creation_flags = self.get_subprocess_config()
-                
-                result = subprocess.run([str(local_ffmpeg), '-version'], 
-                                      capture_output=True, 
-                                      text=True, 
-                                      timeout=10,
-                                      startupinfo=startupinfo, 
-                                      creationflags=creation_flags,
-                                      stdin=subprocess.DEVNULL)
-                if result.returncode == 0:
-                    version_line = result.stdout.split('\n')[0]
-                    self.log_message(f"Local FFmpeg found: {version_line.split()[2]}")
-                    
-                    if self.check_flac_support(str(local_ffmpeg)):
-                        self.install_ffmpeg_btn.config(text="Reinstall FFmpeg")
-                        return True
-                        
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+        if not local_ffmpeg.exists():
+            return False
+
+        ffmpeg_version, flac_supported = probe_ffmpeg(str(local_ffmpeg))
+        if ffmpeg_version is None:
+            return False
+
+        self.log_message(f"Local FFmpeg found: {ffmpeg_version}")
+
+        if self.check_flac_support(flac_supported):
+            self.install_ffmpeg_btn.config(text="Reinstall FFmpeg")
+            return True
         return False
         
-    def check_flac_support(self, ffmpeg_path):
-        """Check if FFmpeg supports FLAC encoding (background execution)"""
-        try:
-            startupinfo, creation_flags = self.get_subprocess_config()
-            
-            flac_test = subprocess.run([ffmpeg_path, '-encoders'], 
-                                     capture_output=True, 
-                                     text=True, 
-                                     timeout=10,
-                                     startupinfo=startupinfo, 
-                                     creationflags=creation_flags,
-                                     stdin=subprocess.DEVNULL)
-            if 'flac' in flac_test.stdout.lower():
-                self.log_message("FLAC encoding supported")
-                return True
-            else:
-                self.log_message("FLAC encoding not supported")
-                return False
-        except Exception:
-            return False
+    def check_flac_support(self, flac_supported):
+        """Report whether the probed FFmpeg supports FLAC encoding"""
+        if flac_supported:
+            self.log_message("FLAC encoding supported")
+        else:
+            self.log_message("FLAC encoding not supported")
+        return flac_supported
             
     def get_ffmpeg_path(self):
         """Get the path to FFmpeg executable"""
@@ -567,17 +1060,19 @@ class WAVtoFLACConverter:
         """
         Calculate optimal FFmpeg threads per process to avoid CPU oversubscription
 
+        Capped at FFMPEG_MAX_THREADS: spare cores are better spent on more parallel conversions.
+
         Args:
             parallel_conversions: Number of parallel file conversions
 
         Returns:
             Number of threads each FFmpeg process should use
         """
-        max_cores = os.cpu_count() or 1
+        max_cores = usable_cpu_count()
 
         # Each FFmpeg process should use a fraction of available cores
         # to avoid oversubscription when multiple conversions run in parallel
-        ffmpeg_threads = max(1, max_cores // parallel_conversions)
+        ffmpeg_threads = max(1, min(FFMPEG_MAX_THREADS, max_cores // parallel_conversions))
 
         return ffmpeg_threads
 
@@ -605,7 +1100,8 @@ class WAVtoFLACConverter:
         formatted_message = f"[{timestamp}] {message}\n"
         
         # Add to queue for thread-safe GUI updates
-        self.log_queue.put(formatted_message)
+        self.log_queue.append(formatted_message)
+        self.notify_queue_update()
         
         # Also log to file if logger is set up
         if self.logger:
@@ -627,20 +1123,23 @@ class WAVtoFLACConverter:
             self.log_file_path = Path(output_dir) / log_filename
             
             # Get the root logger and clear any existing handlers (like original)
+            self.stop_file_logging()
             root_logger = logging.getLogger()
+            for handler in root_logger.handlers:
+                handler.close()
             root_logger.handlers.clear()
             
-            # Configure logging to file only (no console handler)
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler(self.log_file_path, encoding='utf-8')
-                ],
-                force=True  # Force reconfiguration
-            )
-            
-            self.logger = logging.getLogger(__name__)
+            # Configure logging to file only (no console handler). Threads only enqueue records;
+            # a listener thread does all formatting-to-disk, so workers never wait on file writes
+            self.log_file_handler = logging.FileHandler(self.log_file_path, encoding='utf-8')
+            self.log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            log_records = queue.SimpleQueue()
+            self.log_listener = logging.handlers.QueueListener(log_records, self.log_file_handler)
+            self.log_listener.start()
+            root_logger.addHandler(logging.handlers.QueueHandler(log_records))
+            root_logger.setLevel(logging.INFO)
+            
+            self.logger = logger
             self.logger.info("="*80)
             self.logger.info("OPTIMIZED WAV to FLAC Conversion Log Started")
             self.logger.info("="*80)
@@ -651,6 +1150,18 @@ class WAVtoFLACConverter:
             self.log_message(f"Warning: Could not set up file logging: {e}")
             return None, None
         
+    def stop_file_logging(self):
+        """Write out queued log records and log straight to the file again until the next conversion"""
+        if self.log_listener is None:
+            return
+
+        self.log_listener.stop()
+        self.log_listener = None
+
+        root_logger = logging.getLogger()
+        root_logger.handlers.clear()
+        root_logger.addHandler(self.log_file_handler)
+
     def update_progress(self, current, total, message=""):
         """Update progress bar and status"""
         progress_info = {
@@ -658,40 +1169,64 @@ class WAVtoFLACConverter:
             'total': total,
             'message': message
         }
-        self.progress_queue.put(progress_info)
+        self.progress_queue.append(progress_info)
+        self.notify_queue_update()
+
+    def notify_queue_update(self):
+        """Wake the main thread to drain the queues (at most one pending event at a time)"""
+        if self.queue_update_pending:
+            return
+
+        self.queue_update_pending = True
+        try:
+            self.root.event_generate('<<QueueUpdate>>', when='tail')
+        except (RuntimeError, tk.TclError):
+            # Main loop not running (startup/shutdown) - the safety poll picks the update up
+            self.queue_update_pending = False
+
+    def poll_queues(self):
+        """Safety poll in case an update event was missed"""
+        self.process_queues()
+        self.root.after(QUEUE_SAFETY_POLL_MS, self.poll_queues)
         
     def process_queues(self):
         """Process log and progress queues (called from main thread)"""
-        # Process log messages
-        try:
-            while True:
-                message = self.log_queue.get_nowait()
-                self.log_text.insert(tk.END, message)
-                self.log_text.see(tk.END)
-        except queue.Empty:
-            pass
-            
-        # Process progress updates
-        try:
-            while True:
-                progress_info = self.progress_queue.get_nowait()
-                current = progress_info['current']
-                total = progress_info['total']
-                message = progress_info['message']
-                
-                if total > 0:
-                    percentage = (current / total) * 100
-                    self.progress_bar['value'] = percentage
-                    self.progress_var.set(f"Progress: {current}/{total} ({percentage:.1f}%)")
-                
-                if message:
-                    self.status_var.set(message)
-                    
-        except queue.Empty:
-            pass
-            
-        # Schedule next update
-        self.root.after(100, self.process_queues)
+        # Clear first so anything queued while draining posts a new event
+        self.queue_update_pending = False
+
+        # Process log messages - everything queued since the last tick is inserted with one Tk call
+        messages = []
+        while self.log_queue:
+            messages.append(self.log_queue.popleft())
+        if messages:
+            self.log_text.insert(tk.END, ''.join(messages))
+
+            # Keep the widget bounded so inserts and scrolling stay fast on long runs
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{line_count - LOG_MAX_LINES // 2}.0')
+
+            self.log_text.see(tk.END)
+            
+        # Process progress updates - only the latest state is worth drawing
+        latest_progress = None
+        latest_message = None
+        while self.progress_queue:
+            progress_info = self.progress_queue.popleft()
+            if progress_info['total'] > 0:
+                latest_progress = progress_info
+            if progress_info['message']:
+                latest_message = progress_info['message']
+
+        if latest_progress:
+            current = latest_progress['current']
+            total = latest_progress['total']
+            percentage = (current / total) * 100
+            self.progress_bar['value'] = percentage
+            self.progress_var.set(f"Progress: {current}/{total} ({percentage:.1f}%)")
+
+        if latest_message:
+            self.status_var.set(latest_message)
         
     def validate_inputs(self):
         """Validate user inputs before starting conversion"""
@@ -733,120 +1268,35 @@ class WAVtoFLACConverter:
         return True
         
     def find_wav_files(self, directory):
-        """Find all WAV files in directory and subdirectories"""
-        wav_files = []
-        directory = Path(directory)
+        """Find all WAV files in directory and subdirectories, as a sorted list of (path, size in bytes)"""
+        # One traversal with a case-insensitive extension check: every file is seen exactly once,
+        # so no de-duplication is needed (two rglob() passes used to walk the tree twice)
+        return sorted(iter_wav_files(str(directory)))
         
-        # Find WAV files (case insensitive)
-        wav_files.extend(directory.rglob('*.wav'))
-        wav_files.extend(directory.rglob('*.WAV'))
-        
-        return sorted(set(wav_files))
-        
-    def convert_single_file(self, wav_path, input_dir, output_dir, ffmpeg_threads, original_input_dir=None):
-        """Convert a single WAV file to FLAC (with proper background processing)"""
-        start_time = time.time()
-        input_size = 0
-        output_size = 0
-
+    def is_on_same_drive(self, first_path, second_path):
+        """Check whether two existing paths are on the same volume (False if either can't be checked)"""
         try:
-            # Calculate relative path (matching original logic)
-            if original_input_dir and original_input_dir != input_dir:
-                # We're using cache - need to calculate relative path based on original structure
-                relative_path = wav_path.relative_to(input_dir)
-            else:
-                # Direct conversion - calculate relative path normally
-                relative_path = wav_path.relative_to(input_dir)
-
-            # Create output path maintaining directory structure (like original)
-            output_filename = wav_path.stem + ".flac"
-            output_file_path = output_dir / relative_path.parent / output_filename
-
-            # Create subdirectories if they don't exist (like original)
-            output_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Get input file size (like original)
-            input_size = wav_path.stat().st_size
-
-            # Build FFmpeg command with optimization flags and metadata preservation
-            ffmpeg_path = self.get_ffmpeg_path()
-            ffmpeg_cmd = [
-                ffmpeg_path,
-                '-i', str(wav_path),                    # Input file (may be cached)
-                '-threads', str(ffmpeg_threads),        # Thread count (calculated to avoid oversubscription)
-                '-c:a', 'flac',                         # Audio codec: FLAC
-                '-compression_level', str(self.compression_level.get()), # FLAC compression (0=fast, 12=best)
-                '-map_metadata', '0',                   # Copy all metadata from input
-                '-write_bext', '1',                     # Preserve Broadcast Wave Format (BWF) metadata
-                '-y',                                   # Overwrite output files
-                '-v', 'error',                          # Only show errors (reduces overhead)
-                '-nostdin',                             # Don't read from stdin (prevents hanging)
-                str(output_file_path)                   # Output file
-            ]
-            
-            # Get subprocess configuration for background execution
-            startupinfo, creation_flags = self.get_subprocess_config()
-            
-            # Run FFmpeg conversion in complete background
-            result = subprocess.run(
-                ffmpeg_cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout per file
-                startupinfo=startupinfo,
-                creationflags=creation_flags,
-                stdin=subprocess.DEVNULL  # Ensure no stdin interaction
-            )
-            
-            duration = time.time() - start_time
-            
-            if result.returncode == 0:
-                # Get output file size (like original)
-                if output_file_path.exists():
-                    output_size = output_file_path.stat().st_size
-                    compression_ratio = (1 - output_size / input_size) * 100 if input_size > 0 else 0
-
-                    # Preserve file timestamps from original WAV to output FLAC
-                    # If we're using cache, get timestamps from the original file location
-                    if original_input_dir and original_input_dir != input_dir:
-                        # Caching is enabled - get original file path
-                        original_wav_path = original_input_dir / relative_path
-                    else:
-                        # No caching - wav_path is already the original
-                        original_wav_path = wav_path
+            return os.stat(first_path).st_dev == os.stat(second_path).st_dev
+        except OSError:
+            return False
 
-                    try:
-                        # Get timestamps from original WAV file
-                        stat_info = original_wav_path.stat()
-                        # Copy modification time and access time to FLAC file
-                        os.utime(output_file_path, (stat_info.st_atime, stat_info.st_mtime))
-                    except (OSError, IOError) as e:
-                        if self.logger:
-                            self.logger.warning(f"{relative_path}: Could not preserve file timestamps: {e}")
+    def is_on_network_drive(self, path):
+        """Check whether a path is on a network share (UNC path or mapped drive; Windows only, False elsewhere)"""
+        if sys.platform != "win32":
+            return False
+        path_str = str(path)
+        if path_str.startswith(('\\\\', '//')):
+            return True
+        drive = os.path.splitdrive(os.path.abspath(path_str))[0]
+        try:
+            return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == 4  # DRIVE_REMOTE
+        except Exception:
+            return False
 
-                    # Message format exactly like original script
-                    message = f"Converted to {output_filename} ({compression_ratio:.1f}% smaller, {duration:.2f}s)"
-                    return True, str(relative_path), message, input_size, output_size
-                else:
-                    error_msg = "FFmpeg completed but output file not found"
-                    return False, str(relative_path), error_msg, input_size, 0
-            else:
-                # Error message format like original script
-                error_msg = f"FFmpeg error (code {result.returncode}): {result.stderr.strip()}"
-                return False, str(relative_path), error_msg, input_size, 0
-                
-        except subprocess.TimeoutExpired:
-            error_msg = "Conversion timed out (>5 minutes)"
-            return False, str(relative_path), error_msg, input_size, 0
-        except Exception as e:
-            relative_path = wav_path.relative_to(input_dir)
-            error_msg = f"Unexpected error: {str(e)}"
-            return False, str(relative_path), error_msg, input_size, 0
-            
-    def check_cache_disk_space(self, wav_files, cache_dir):
-        """Check if cache directory has enough space for all WAV files"""
-        # Calculate total size of all WAV files
-        total_size_bytes = sum(f.stat().st_size for f in wav_files)
+    def check_cache_disk_space(self, file_sizes, cache_dir):
+        """Check if cache directory has enough space for WAV files of the given sizes"""
+        # Calculate total size of all WAV files (sizes come from the directory scan)
+        total_size_bytes = sum(file_sizes)
         total_size_gb = total_size_bytes / (1024 ** 3)
 
         try:
@@ -932,25 +1382,36 @@ class WAVtoFLACConverter:
                 self.logger.warning(f"Could not calculate optimal batch size: {e}, using default")
             return INPUT_CACHE_BATCH_SIZE  # Fall back to default
 
-    def copy_single_file_to_cache(self, wav_file, input_dir, cache_dir, file_index, total_files):
-        """Copy a single WAV file to local cache"""
-        try:
-            relative_path = wav_file.relative_to(input_dir)
-            cached_file = cache_dir / relative_path
+    def create_directory_tree(self, relative_paths, target_dir):
+        """
+        Create the parent directories of the given relative file paths below target_dir
 
-            # Create subdirectories in cache
-            cached_file.parent.mkdir(parents=True, exist_ok=True)
+        Each distinct directory is created once, instead of one mkdir() call per file,
+        which matters on network shares where every call is a round trip.
+        """
+        target_dir = Path(target_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
 
-            # Verify source file exists and get size
+        subdirectories = {relative_path.parent for relative_path in relative_paths}
+        for subdirectory in sorted(subdirectories):
             try:
-                file_size = wav_file.stat().st_size
-            except (OSError, IOError) as e:
-                return False, None, relative_path, 0, 0, file_index, total_files, f"Cannot read source file: {str(e)}"
+                (target_dir / subdirectory).mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                # Files in this directory will fail individually and be reported
+                if self.logger:
+                    self.logger.error(f"Cannot create directory {target_dir / subdirectory}: {e}")
+
+    def copy_single_file_to_cache(self, wav_file, relative_path, file_size, cache_dir, file_index, total_files):
+        """Copy a single WAV file to local cache (file_size comes from the directory scan, so the source isn't stat'ed again)"""
+        try:
+            cached_file = cache_dir / relative_path
+
+            # Cache subdirectories were created up front by create_directory_tree()
 
             # Copy file
             start_time = time.time()
 
-            shutil.copy2(wav_file, cached_file)
+            copy_file_to_cache(wav_file, cached_file)
 
             # Verify the cached file size matches the source
             cached_size = cached_file.stat().st_size
@@ -959,80 +1420,94 @@ class WAVtoFLACConverter:
                 return False, None, relative_path, 0, 0, file_index, total_files, f"Copy verification failed: source {file_size} bytes, cached {cached_size} bytes"
 
             copy_time = time.time() - start_time
-            copy_speed = file_size / copy_time / (1024 * 1024) if copy_time > 0 else 0
 
-            return True, cached_file, relative_path, file_size, copy_speed, file_index, total_files
+            return True, cached_file, relative_path, file_size, copy_time, file_index, total_files
 
         except (OSError, IOError, PermissionError) as e:
-            try:
-                relative_path = wav_file.relative_to(input_dir)
-            except ValueError:
-                relative_path = Path(wav_file.name)
             return False, None, relative_path, 0, 0, file_index, total_files, f"File operation error: {str(e)}"
         except Exception as e:
-            try:
-                relative_path = wav_file.relative_to(input_dir)
-            except ValueError:
-                relative_path = Path(wav_file.name)
             return False, None, relative_path, 0, 0, file_index, total_files, f"Unexpected error: {str(e)}"
 
-    def copy_files_to_cache(self, wav_files, input_dir, cache_dir):
-        """Copy WAV files to cache directory using optimized concurrent threads"""
+    def iter_cached_files(self, wav_files, relative_paths, file_sizes, cache_dir):
+        """
+        Copy WAV files to cache directory using concurrent threads and yield (index, cached file) as soon as each is ready
+
+        Conversion starts on the first cached file instead of waiting for the whole batch, so
+        network reads overlap with encoding. At most CACHE_PREFETCH_PER_THREAD files per copy
+        thread are copied ahead of the consumer; when the generator is closed, pending copies
+        are cancelled and the running ones finish before it returns.
+        """
         self.log_message(f"Copying {len(wav_files)} files to local cache...")
 
         if self.logger:
             self.logger.info(f"Starting cache operation for {len(wav_files)} files")
             self.logger.info(f"Cache directory: {str(cache_dir)}")
 
-        cached_files = []
+        cached_count = 0
         failed_copies = []
         completed_count = 0
 
         try:
             cache_path = Path(cache_dir)
-            cache_path.mkdir(parents=True, exist_ok=True)
+            self.create_directory_tree(relative_paths, cache_path)
 
             # Use more threads for I/O operations (copying is I/O bound, not CPU bound)
             copy_threads = min(CACHE_COPY_THREADS, len(wav_files))
+            max_pending = max(1, copy_threads * CACHE_PREFETCH_PER_THREAD)
+            numbered_files = enumerate(wav_files)
 
             # Use ThreadPoolExecutor for file copying
             with ThreadPoolExecutor(max_workers=copy_threads) as executor:
-                # Submit all copy tasks
-                future_to_file = {
-                    executor.submit(self.copy_single_file_to_cache, wav_file, input_dir, cache_path, i+1, len(wav_files)): wav_file
-                    for i, wav_file in enumerate(wav_files)
-                }
-
-                # Process completed tasks as they finish
-                for future in as_completed(future_to_file):
-                    if not self.is_converting:  # Check if stopped
-                        break
-
-                    result = future.result()
-
-                    if result[0]:  # Success
-                        _, cached_file, relative_path, _, copy_speed, _, total_files = result
-                        cached_files.append(cached_file)
-                        completed_count += 1
-
-                        # Show progress every 10 files or for small batches
-                        if completed_count % 10 == 0 or len(wav_files) <= 20:
-                            progress_msg = f"Cached {completed_count}/{total_files} files..."
-                            self.log_message(f"{progress_msg}")
-                            if self.logger:
-                                self.logger.info(f"Cached: {relative_path} ({copy_speed:.1f} MB/s)")
+                def submit_copy(file_index, wav_file):
+                    future = executor.submit(self.copy_single_file_to_cache, wav_file, relative_paths[file_index],
+                                             file_sizes[file_index], cache_path, file_index, len(wav_files))
+                    future_to_file[future] = wav_file
+                    return future
 
-                        self.update_progress(completed_count, len(wav_files), f"Caching: {relative_path.name}")
+                future_to_file = {}
+                pending = {submit_copy(i, wav_file) for i, wav_file in itertools.islice(numbered_files, max_pending)}
 
-                    else:  # Failed
-                        _, _, relative_path, _, _, _, total_files, error_msg = result
-                        failed_copies.append((future_to_file[future], error_msg))
-                        completed_count += 1
-
-                        error_msg_display = f"Cache failed: {relative_path}"
-                        self.log_message(f"{error_msg_display}")
-                        if self.logger:
-                            self.logger.error(f"Cache failed: {relative_path} - {error_msg}")
+                try:
+                    # Process completed tasks as they finish
+                    while pending and self.is_converting:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                        for future in done:
+                            # Start the next copy before handing this file on, so the copy threads stay busy
+                            next_file = next(numbered_files, None)
+                            if next_file is not None:
+                                pending.add(submit_copy(*next_file))
+
+                            result = future.result()
+                            wav_file = future_to_file.pop(future)
+                            completed_count += 1
+
+                            if result[0]:  # Success
+                                _, cached_file, relative_path, file_size, copy_time, file_index, total_files = result
+                                cached_count += 1
+
+                                # Show progress every 10 files or for small batches
+                                if completed_count % 10 == 0 or len(wav_files) <= 20:
+                                    progress_msg = f"Cached {completed_count}/{total_files} files..."
+                                    self.log_message(f"{progress_msg}")
+                                    if self.logger:
+                                        # Copy speed is only worked out for the files that get logged
+                                        copy_speed = file_size / copy_time / (1024 * 1024) if copy_time > 0 else 0
+                                        self.logger.info(f"Cached: {relative_path} ({copy_speed:.1f} MB/s)")
+
+                                yield file_index, cached_file
+
+                            else:  # Failed
+                                _, _, relative_path, _, _, _, total_files, error_msg = result
+                                failed_copies.append((wav_file, error_msg))
+
+                                error_msg_display = f"Cache failed: {relative_path}"
+                                self.log_message(f"{error_msg_display}")
+                                if self.logger:
+                                    self.logger.error(f"Cache failed: {relative_path} - {error_msg}")
+                finally:
+                    for future in pending:
+                        future.cancel()
 
         except Exception as e:
             error_msg = f"Cache setup error: {e}"
@@ -1041,7 +1516,7 @@ class WAVtoFLACConverter:
                 self.logger.error(error_msg)
                 
         # Final summary (like original)
-        summary_msg = f"Caching completed: {len(cached_files)} files ready for conversion"
+        summary_msg = f"Caching completed: {cached_count} files cached"
         self.log_message(f"{summary_msg}")
         if self.logger:
             self.logger.info(summary_msg)
@@ -1051,8 +1526,6 @@ class WAVtoFLACConverter:
             self.log_message(f"{failure_msg}")
             if self.logger:
                 self.logger.warning(failure_msg)
-                
-        return cached_files
         
     def cleanup_cache(self, cache_dir):
         """
@@ -1086,11 +1559,8 @@ class WAVtoFLACConverter:
             if self.logger:
                 self.logger.info("Starting cache cleanup")
 
-            # Count files before deletion for logging
-            file_count = sum(1 for _ in cache_path.rglob('*') if _.is_file())
-
-            # Delete the entire unique cache subdirectory
-            shutil.rmtree(cache_path)
+            # Delete the entire unique cache subdirectory (counting files as they are removed)
+            file_count = self.delete_directory_tree(cache_path)
 
             cleanup_msg = f"Cache cleanup completed. Removed {file_count} cached files."
             self.log_message(f"{cleanup_msg}")
@@ -1104,13 +1574,173 @@ class WAVtoFLACConverter:
             if self.logger:
                 self.logger.error(f"Cache cleanup failed: {e}", exc_info=True)
             
-    def conversion_worker(self):
-        """Main conversion worker thread"""
+    def delete_directory_tree(self, directory):
+        """
+        Delete a directory tree with the file unlinks spread over CACHE_COPY_THREADS threads
+
+        One walk collects every file and directory; the files are unlinked in parallel (keeping
+        the disk's queue busy, unlike shutil.rmtree's one-at-a-time unlinks), then the now-empty
+        directories are removed deepest first.
+
+        Returns:
+            int: Number of files deleted
+        """
+        file_paths = []
+        directory_paths = []
+        for root, _, files in os.walk(directory, topdown=False):
+            file_paths.extend(os.path.join(root, name) for name in files)
+            directory_paths.append(root)
+
+        with ThreadPoolExecutor(max_workers=CACHE_COPY_THREADS) as executor:
+            # list() re-raises the first unlink error, after every unlink has been attempted
+            list(executor.map(os.unlink, file_paths))
+
+        for directory_path in directory_paths:
+            os.rmdir(directory_path)
+
+        return len(file_paths)
+
+    def iter_conversion_results(self, tasks, parallel_conversions, conversion_options, ffmpeg_batch_size=1):
+        """
+        Run conversions in the worker process pool and yield their results as they complete
+
+        Only INFLIGHT_TASKS_PER_WORKER tasks per worker are submitted at a time; each finished
+        task is replaced by the next one. If the caller stops early, queued conversions are
+        cancelled and the ones already running are waited for, so stopping never waits for
+        the whole file list and no worker is still reading a cached file afterwards.
+
+        Without a process pool (FFmpeg-only runs) the conversions are driven by an asyncio
+        event loop instead, up to ffmpeg_batch_size files per FFmpeg process; see run_conversions_async().
+
+        Args:
+            tasks: Iterable of (wav_path, relative_path, output_file_path, original_wav_path, input_size) tuples
+            parallel_conversions: Number of worker processes
+            conversion_options: ffmpeg_args and compression_level for convert_single_file() (the process
+                pool already got them through init_conversion_worker())
+            ffmpeg_batch_size: Maximum small files per FFmpeg process (FFmpeg-only runs)
+        """
+        if self.executor is None:
+            # FFmpeg-only runs need no workers: an asyncio event loop waits on all FFmpeg processes
+            batches = iter_ffmpeg_batches(tasks, ffmpeg_batch_size, lambda: self.is_converting)
+            yield from self.iter_async_conversion_results(batches, parallel_conversions, conversion_options)
+            return
+
+        tasks = iter(tasks)
+        max_inflight = max(1, parallel_conversions * INFLIGHT_TASKS_PER_WORKER)
+        inflight = {self.executor.submit(convert_file_in_worker, *task) for task in itertools.islice(tasks, max_inflight)}
+
+        try:
+            while inflight:
+                done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    # Refill the window before handling results so no worker sits idle
+                    # (but submit nothing new once Stop was pressed)
+                    next_task = next(tasks, None) if self.is_converting else None
+                    if next_task is not None:
+                        inflight.add(self.executor.submit(convert_file_in_worker, *next_task))
+
+                    yield future.result()
+        finally:
+            for future in inflight:
+                future.cancel()
+            wait(inflight)
+
+    def iter_async_conversion_results(self, batches, parallel_conversions, conversion_options):
+        """
+        Run FFmpeg conversions on an asyncio event loop in a helper thread and yield their results as they complete
+
+        Stopping early (pressing Stop or closing the generator) lets the running conversions finish
+        and starts no new ones.
+        """
+        results = queue.SimpleQueue()
+        stop_event = threading.Event()
+        loop_thread = threading.Thread(
+            target=lambda: asyncio.run(self.run_conversions_async(batches, parallel_conversions, conversion_options,
+                                                          results, stop_event)),
+            daemon=True)
+        loop_thread.start()
+
+        try:
+            # run_conversions_async() puts None once every conversion has finished,
+            # after the exception if the run broke off
+            for result in iter(results.get, None):
+                if isinstance(result, Exception):
+                    raise result
+                yield result
+        finally:
+            stop_event.set()
+            loop_thread.join()
+
+    async def run_conversions_async(self, batches, parallel_conversions, conversion_options, results, stop_event):
+        """Keep up to parallel_conversions FFmpeg processes running until the batches run out, Stop is pressed or stop_event is set"""
+        semaphore = asyncio.Semaphore(parallel_conversions)
+        running = set()
+        batches = iter(batches)
+
+        async def convert(batch):
+            try:
+                batch_results = await convert_batch_async(batch, **conversion_options)
+            except Exception as e:
+                # Count the whole batch as failed instead of ending the run
+                batch_results = [(False, str(task[1]), f"Unexpected error: {e}", task[4], 0) for task in batch]
+            for result in batch_results:
+                results.put(result)
+            semaphore.release()
+
+        try:
+            while True:
+                await semaphore.acquire()
+                if stop_event.is_set() or not self.is_converting:
+                    break
+
+                # The task source may block (e.g. waiting for a cache copy), so pull from it off the loop
+                batch = await asyncio.to_thread(next, batches, None)
+                if batch is None or stop_event.is_set() or not self.is_converting:
+                    break
+
+                conversion = asyncio.create_task(convert(batch))
+                running.add(conversion)
+                conversion.add_done_callback(running.discard)
+
+            await asyncio.gather(*running)
+        except Exception as e:
+            # The task source failed (e.g. the cache copy broke off): finish the running
+            # conversions, then hand the error to the consumer so the run isn't reported as complete
+            await asyncio.gather(*running, return_exceptions=True)
+            results.put(e)
+        finally:
+            results.put(None)
+
+    def snapshot_conversion_settings(self, wav_files=None):
+        """
+        Read the conversion settings from the Tk variables (main thread only)
+
+        The worker thread gets plain Python values, so it never calls into Tcl. wav_files is the
+        find_wav_files() result start_conversion() already has, so the tree isn't scanned twice
+        (None makes the worker scan it).
+        """
+        return types.SimpleNamespace(
+            wav_files=wav_files,
+            input_dir=Path(self.input_dir.get()),
+            output_dir=Path(self.output_dir.get()),
+            use_cache=self.use_cache.get(),
+            cache_dir=Path(self.cache_dir.get()),
+            batch_size=self.cache_batch_size.get(),
+            thread_count=self.thread_count.get(),
+            compression_level=self.compression_level.get(),
+            skip_converted=self.skip_converted.get(),
+            ffmpeg_path=self.get_ffmpeg_path(),
+        )
+
+    def conversion_worker(self, settings):
+        """Main conversion worker thread (settings come from snapshot_conversion_settings())"""
+        log_listener = None
         try:
             self.log_message("Starting conversion...")
             
-            input_dir = Path(self.input_dir.get())
-            output_dir = Path(self.output_dir.get())
+            input_dir = settings.input_dir
+            output_dir = settings.output_dir
             
             # Create output directory (like original script)
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -1119,30 +1749,64 @@ class WAVtoFLACConverter:
             # Set up file logging
             self.setup_file_logging(output_dir)
             
-            # Find WAV files
-            wav_files = self.find_wav_files(input_dir)
+            # Find WAV files (reusing the scan done for the confirmation dialog)
+            scanned_files = settings.wav_files if settings.wav_files is not None else self.find_wav_files(input_dir)
+            wav_files = [wav_file for wav_file, _ in scanned_files]
+            file_sizes = [file_size for _, file_size in scanned_files]
             if not wav_files:
                 self.log_message("No WAV files found")
                 return
                 
             self.log_message(f"Found {len(wav_files)} WAV files")
+
+            # Plan every file's paths once; workers and the cache copier reuse them instead of
+            # recomputing relative paths, and every output subdirectory is created before any conversion starts
+            relative_paths = [wav_file.relative_to(input_dir) for wav_file in wav_files]
+            output_paths = [output_dir / relative_path.with_suffix('.flac') for relative_path in relative_paths]
+
+            # Re-runs only convert what is missing or changed
+            if settings.skip_converted:
+                pending = [index for index, (wav_file, output_path) in enumerate(zip(wav_files, output_paths))
+                           if not is_output_up_to_date(wav_file, output_path)]
+                skipped = len(wav_files) - len(pending)
+                if skipped:
+                    wav_files = [wav_files[index] for index in pending]
+                    file_sizes = [file_sizes[index] for index in pending]
+                    relative_paths = [relative_paths[index] for index in pending]
+                    output_paths = [output_paths[index] for index in pending]
+                    self.log_message(f"Skipping {skipped} file(s) already converted in {output_dir}")
+                    if self.logger:
+                        self.logger.info(f"Skipped {skipped} up-to-date file(s)")
+                if not wav_files:
+                    self.log_message("All files are already converted")
+                    return
+
+            self.create_directory_tree(relative_paths, output_dir)
             
             # Handle caching - hybrid batch caching for large file sets
-            original_input_dir = input_dir
             use_batch_caching = False
-            batch_size = self.cache_batch_size.get()  # Always use current slider value
+            batch_size = settings.batch_size  # Slider value when Start was clicked
+
+            # Copying files to the drive they are already on only doubles the reads - convert in place
+            source_on_cache_drive = settings.use_cache and self.is_on_same_drive(input_dir, settings.cache_dir)
+            use_cache = settings.use_cache and not source_on_cache_drive
+            if source_on_cache_drive:
+                self.log_message("Source is already on the cache drive - skipping cache")
+            elif not settings.use_cache and self.is_on_network_drive(input_dir):
+                # Leave the choice to the user (local RAID arrays benefit too), but point out the usual win
+                self.log_message("Source is on a network drive - enabling 'Cache input files' usually converts faster")
 
             # Log the batch size being used
-            if self.use_cache.get():
+            if use_cache:
                 self.log_message(f"Using batch size: {batch_size} files")
 
             # Determine if we should use batch caching (unified approach for all caching)
-            if self.use_cache.get():
+            if use_cache:
                 use_batch_caching = True
                 num_batches = (len(wav_files) + batch_size - 1) // batch_size
                 if num_batches > 1:
                     self.log_message(f"Batch caching enabled: processing {num_batches} batches of ~{batch_size} files")
-                    self.log_message(f"   This allows full {self.thread_count.get()}-core utilization with limited cache space")
+                    self.log_message(f"   This allows full {settings.thread_count}-core utilization with limited cache space")
                 else:
                     self.log_message(f"Batch caching enabled: processing all {len(wav_files)} files in 1 batch")
                 if self.logger:
@@ -1157,22 +1821,46 @@ class WAVtoFLACConverter:
             start_time = time.time()
 
             # Calculate FFmpeg threads and parallelism based on caching mode
-            if use_batch_caching:
-                # Caching enabled - use parallel conversions
-                parallel_conversions = self.thread_count.get()
+            if use_batch_caching or source_on_cache_drive:
+                # Caching enabled (or files already local) - use parallel conversions
+                parallel_conversions = settings.thread_count
                 ffmpeg_threads = self.calculate_ffmpeg_threads(parallel_conversions)
                 self.log_message(f"Using {parallel_conversions} parallel conversions with {ffmpeg_threads} thread(s) per FFmpeg process")
             else:
-                # No caching - limited parallel conversion (4 files at a time) to avoid network/RAID I/O thrashing
-                parallel_conversions = 4
-                total_cores = os.cpu_count() or 1
-                ffmpeg_threads = max(1, total_cores // parallel_conversions)  # Divide cores among 4 processes
+                # No caching - limited parallel conversion (up to 4 files at a time) to avoid network/RAID I/O thrashing
+                parallel_conversions = min(4, usable_cpu_count())  # Never more processes than usable CPUs
+                ffmpeg_threads = self.calculate_ffmpeg_threads(parallel_conversions)  # Divide cores among the processes
                 self.log_message(f"Sequential conversion mode: processing {parallel_conversions} files at a time with {ffmpeg_threads} thread(s) per file")
 
+            if USE_NATIVE_ENCODER and HAS_SOUNDFILE:
+                self.log_message("Encoding in-process with libsndfile (FFmpeg is used for unsupported files)")
+
+            conversion_options = dict(
+                ffmpeg_args=build_ffmpeg_args(settings.ffmpeg_path, ffmpeg_threads, settings.compression_level),
+                compression_level=settings.compression_level,
+            )
+
+            # Batch small files per FFmpeg process, but never so many that some processes sit idle
+            ffmpeg_batch_size = min(FFMPEG_BATCH_SIZE, max(1, len(wav_files) // parallel_conversions))
+
+            if USE_NATIVE_ENCODER and HAS_SOUNDFILE:
+                # In-process encoding runs in worker processes (each with its own GIL); their log records
+                # come back through a queue and are written by this process's file handler.
+                # 'spawn' everywhere (the Windows default): forking this multi-threaded Tk process is unsafe
+                worker_context = multiprocessing.get_context('spawn')
+                worker_log_queue = worker_context.Queue()
+                log_listener = logging.handlers.QueueListener(
+                    worker_log_queue, *([self.log_file_handler] if self.log_file_handler else []))
+                log_listener.start()
+                self.executor = ProcessPoolExecutor(max_workers=parallel_conversions,
+                                                    mp_context=worker_context,
+                                                    initializer=init_conversion_worker,
+                                                    initargs=(worker_log_queue, conversion_options))
+
             # Process files - either in batches (hybrid caching) or all at once
             if use_batch_caching:
                 # Hybrid batch caching: process batch_size files at a time
-                parent_cache_dir = Path(self.cache_dir.get())
+                parent_cache_dir = settings.cache_dir
                 total_files_processed = 0
 
                 for batch_idx in range(0, len(wav_files), batch_size):
@@ -1181,11 +1869,12 @@ class WAVtoFLACConverter:
 
                     batch_end = min(batch_idx + batch_size, len(wav_files))
                     batch_files = wav_files[batch_idx:batch_end]
+                    batch_relative_paths = relative_paths[batch_idx:batch_end]
                     batch_num = (batch_idx // batch_size) + 1
                     total_batches = (len(wav_files) + batch_size - 1) // batch_size
 
                     self.log_message(f"")
-                    self.log_message(f"Batch {batch_num}/{total_batches}: Caching {len(batch_files)} files...")
+                    self.log_message(f"Batch {batch_num}/{total_batches}: Caching and converting {len(batch_files)} files...")
 
                     # Create batch-specific cache directory
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1200,7 +1889,7 @@ class WAVtoFLACConverter:
                         continue
 
                     # Check if there's enough disk space for this batch
-                    if not self.check_cache_disk_space(batch_files, cache_dir_path):
+                    if not self.check_cache_disk_space(file_sizes[batch_idx:batch_end], cache_dir_path):
                         self.log_message(f"Insufficient disk space for batch {batch_num}. Stopping conversion.")
                         if self.logger:
                             self.logger.error(f"Batch {batch_num} cancelled: insufficient disk space")
@@ -1210,32 +1899,23 @@ class WAVtoFLACConverter:
                             pass
                         break
 
-                    # Cache this batch
-                    cached_files = self.copy_files_to_cache(batch_files, input_dir, cache_dir_path)
-
-                    if not self.is_converting:
-                        self.cleanup_cache(cache_dir_path)
-                        break
+                    # Cache this batch; each file is converted as soon as its copy finishes
+                    cached_files = self.iter_cached_files(batch_files, batch_relative_paths, file_sizes[batch_idx:batch_end],
+                                                          cache_dir_path)
 
                     self.log_message(f"Converting batch {batch_num}/{total_batches} with {parallel_conversions} cores...")
 
                     # Convert this batch
-                    with ThreadPoolExecutor(max_workers=parallel_conversions) as executor:
-                        futures = {
-                            executor.submit(self.convert_single_file, wav_file, cache_dir_path,
-                                          output_dir, ffmpeg_threads, original_input_dir): wav_file
-                            for wav_file in cached_files
-                        }
-
-                        for future in as_completed(futures):
+                    tasks = ((cached_file, batch_relative_paths[i], output_paths[batch_idx + i], batch_files[i],
+                              file_sizes[batch_idx + i]) for i, cached_file in cached_files)
+                    results = self.iter_conversion_results(tasks, parallel_conversions, conversion_options, ffmpeg_batch_size)
+
+                    try:
+                        for success, relative_path, message, input_size, output_size in results:
                             if not self.is_converting:
-                                # Cleanup cache before breaking
-                                self.log_message(f"Cleaning up batch {batch_num} cache...")
-                                self.cleanup_cache(cache_dir_path)
                                 break
 
                             total_files_processed += 1
-                            success, relative_path, message, input_size, output_size = future.result()
 
                             if success:
                                 successful += 1
@@ -1248,46 +1928,52 @@ class WAVtoFLACConverter:
                                 if self.logger:
                                     self.logger.error(f"Conversion failed: {relative_path} - {message}")
 
-                            self.update_progress(total_files_processed, len(wav_files), f"Converted: {Path(relative_path).name}")
+                            self.update_progress(total_files_processed, len(wav_files), f"Converted: {os.path.basename(relative_path)}")
+                    finally:
+                        # When stopped early (or on an error) this waits for the conversions still reading
+                        # cached files and the copies still writing them
+                        results.close()
+                        cached_files.close()
 
-                    # Cleanup cache for this batch (if not already cleaned up during stop)
-                    if self.is_converting:
+                        # Cleanup cache for this batch
                         self.log_message(f"Cleaning up batch {batch_num} cache...")
                         self.cleanup_cache(cache_dir_path)
 
             else:
-                # No caching - convert with limited parallelism (4 at a time) to avoid network/RAID I/O thrashing
-                self.log_message("Converting files with limited parallelism (no cache = network-friendly mode)")
-                self.log_message(f"Processing {len(wav_files)} files, {parallel_conversions} at a time to prevent I/O bottleneck")
+                if source_on_cache_drive:
+                    self.log_message(f"Converting {len(wav_files)} files in place, {parallel_conversions} at a time")
+                else:
+                    # No caching - convert with limited parallelism (up to 4 at a time) to avoid network/RAID I/O thrashing
+                    self.log_message("Converting files with limited parallelism (no cache = network-friendly mode)")
+                    self.log_message(f"Processing {len(wav_files)} files, {parallel_conversions} at a time to prevent I/O bottleneck")
 
                 files_processed = 0
-                with ThreadPoolExecutor(max_workers=parallel_conversions) as executor:
-                    futures = {
-                        executor.submit(self.convert_single_file, wav_file, input_dir,
-                                      output_dir, ffmpeg_threads, None): wav_file
-                        for wav_file in wav_files
-                    }
-
-                    for future in as_completed(futures):
-                        if not self.is_converting:
-                            break
+                tasks = ((wav_file, relative_path, output_path, wav_file, file_size)
+                         for wav_file, relative_path, output_path, file_size
+                         in zip(wav_files, relative_paths, output_paths, file_sizes))
+                results = self.iter_conversion_results(tasks, parallel_conversions, conversion_options, ffmpeg_batch_size)
+
+                for success, relative_path, message, input_size, output_size in results:
+                    if not self.is_converting:
+                        break
+
+                    files_processed += 1
+
+                    if success:
+                        successful += 1
+                        total_input_size += input_size
+                        total_output_size += output_size
+                        self.log_message(f"{relative_path}: {message}")
+                    else:
+                        failed += 1
+                        self.log_message(f"FAILED - {relative_path}: {message}")
+                        if self.logger:
+                            self.logger.error(f"Conversion failed: {relative_path} - {message}")
+
+                    self.update_progress(files_processed, len(wav_files), f"Converted: {os.path.basename(relative_path)}")
+
+                results.close()
 
-                        files_processed += 1
-                        success, relative_path, message, input_size, output_size = future.result()
-
-                        if success:
-                            successful += 1
-                            total_input_size += input_size
-                            total_output_size += output_size
-                            self.log_message(f"{relative_path}: {message}")
-                        else:
-                            failed += 1
-                            self.log_message(f"FAILED - {relative_path}: {message}")
-                            if self.logger:
-                                self.logger.error(f"Conversion failed: {relative_path} - {message}")
-
-                        self.update_progress(files_processed, len(wav_files), f"Converted: {Path(relative_path).name}")
-                    
             # Summary
             total_time = time.time() - start_time
 
@@ -1306,6 +1992,14 @@ class WAVtoFLACConverter:
                 self.logger.error(f"Unexpected error: {e}", exc_info=True)
         finally:
             # Note: Cache cleanup is now handled within each branch (batch caching cleans after each batch)
+
+            # Shut down the worker processes, then write out their remaining log records
+            if self.executor:
+                self.executor.shutdown(wait=True, cancel_futures=True)
+                self.executor = None
+            if log_listener:
+                log_listener.stop()
+            self.stop_file_logging()
                 
             # Reset UI state
             self.root.after(0, self.conversion_finished)
@@ -1327,7 +2021,7 @@ class WAVtoFLACConverter:
             messagebox.showwarning("No Files", "No WAV files found in the selected directory")
             return
             
-        total_size_mb = sum(f.stat().st_size for f in wav_files) / (1024 * 1024)
+        total_size_mb = sum(file_size for _, file_size in wav_files) / (1024 * 1024)
         
         message = (f"Found {len(wav_files)} WAV files ({total_size_mb:.1f} MB)\n\n"
                   f"Output: {str(Path(self.output_dir.get()))}\n\n"
@@ -1352,7 +2046,8 @@ class WAVtoFLACConverter:
         self.status_var.set("")
         
         # Start worker thread
-        self.conversion_thread = threading.Thread(target=self.conversion_worker, daemon=True)
+        settings = self.snapshot_conversion_settings(wav_files)
+        self.conversion_thread = threading.Thread(target=self.conversion_worker, args=(settings,), daemon=True)
         self.conversion_thread.start()
         
     def stop_conversion(self):
@@ -1370,14 +2065,12 @@ class WAVtoFLACConverter:
             
         # Create installation dialog
         install_dialog = tk.Toplevel(self.root)
+        install_dialog.transient(self.root)  # Before the window is configured, so the WM sets it up once
         install_dialog.title("Install FFmpeg")
-        install_dialog.geometry("520x240")
         install_dialog.resizable(False, False)
-        install_dialog.grab_set()  # Make dialog modal
         
-        # Center the dialog
-        install_dialog.transient(self.root)
-        install_dialog.geometry("+%d+%d" % (
+        # Size and center the dialog in one geometry call
+        install_dialog.geometry("520x240+%d+%d" % (
             self.root.winfo_rootx() + 100,
             self.root.winfo_rooty() + 50
         ))
@@ -1420,6 +2113,8 @@ class WAVtoFLACConverter:
         
         # Store dialog reference
         self.install_dialog = install_dialog
+
+        install_dialog.grab_set()  # Make dialog modal once it is fully built
         
     def start_ffmpeg_installation(self, dialog):
         """Start FFmpeg installation in background thread"""
@@ -1559,13 +2254,24 @@ class WAVtoFLACConverter:
             })
             with urllib.request.urlopen(request, context=ssl_context, timeout=300) as response:
                 total_size = int(response.getheader('Content-Length', 0))
-                block_size = 8192
+
+                if (response.getheader('Accept-Ranges', '').lower() == 'bytes'
+                        and total_size >= DOWNLOAD_MIN_RANGED_SIZE):
+                    # Fetch disjoint ranges in parallel from the final (redirected) URL instead
+                    response.close()
+                    self.download_file_in_ranges(response.geturl(), request.headers, filepath, total_size, ssl_context)
+                    self.log_message("Download completed successfully")
+                    return
+
                 downloaded = 0
                 with open(filepath, 'wb') as f:
+                    if total_size > 0:
+                        # Reserve the full size once instead of growing the file with every write
+                        f.truncate(total_size)
                     while True:
                         if not self.is_installing_ffmpeg:
                             raise urllib.error.URLError("Download cancelled")
-                        buffer = response.read(block_size)
+                        buffer = response.read(DOWNLOAD_BLOCK_SIZE)
                         if not buffer:
                             break
                         f.write(buffer)
@@ -1575,6 +2281,9 @@ class WAVtoFLACConverter:
                             downloaded_mb = downloaded / (1024 * 1024)
                             total_mb = total_size / (1024 * 1024)
                             self.update_install_progress(f"Downloading: {downloaded_mb:.1f} / {total_mb:.1f} MB", progress)
+                # The file was pre-sized, so a short download would otherwise look complete
+                if total_size > 0 and downloaded != total_size:
+                    raise urllib.error.URLError(f"incomplete download ({downloaded} of {total_size} bytes)")
             self.log_message("Download completed successfully")
             return
         except Exception as e:
@@ -1584,37 +2293,76 @@ class WAVtoFLACConverter:
                 raise Exception(error_msg)
             raise Exception("Download cancelled")
             
+    def download_file_in_ranges(self, url, headers, filepath, total_size, ssl_context):
+        """
+        Download a file as DOWNLOAD_RANGES HTTP byte ranges, DOWNLOAD_THREADS at a time
+
+        The file is pre-sized and every range is written at its own offset through its own
+        file handle, so the threads never share a file position.
+        """
+        range_size = -(-total_size // DOWNLOAD_RANGES)  # Ceiling division
+        ranges = [(start, min(start + range_size, total_size) - 1) for start in range(0, total_size, range_size)]
+        downloaded = 0
+        progress_lock = threading.Lock()
+
+        def download_range(start, end):
+            nonlocal downloaded
+            request = urllib.request.Request(url, headers={**headers, 'Range': f'bytes={start}-{end}'})
+            with urllib.request.urlopen(request, context=ssl_context, timeout=300) as response:
+                if response.status != 206:
+                    raise urllib.error.URLError(f"server ignored the byte range request (HTTP {response.status})")
+                with open(filepath, 'r+b') as f:
+                    f.seek(start)
+                    remaining = end - start + 1
+                    while remaining > 0:
+                        if not self.is_installing_ffmpeg:
+                            raise urllib.error.URLError("Download cancelled")
+                        buffer = response.read(min(DOWNLOAD_BLOCK_SIZE, remaining))
+                        if not buffer:
+                            raise urllib.error.URLError(f"incomplete download (range {start}-{end} ended early)")
+                        f.write(buffer)
+                        remaining -= len(buffer)
+                        with progress_lock:
+                            downloaded += len(buffer)
+                            progress = min(int((downloaded / total_size) * 70), 70)
+                            downloaded_mb = downloaded / (1024 * 1024)
+                        total_mb = total_size / (1024 * 1024)
+                        self.update_install_progress(f"Downloading: {downloaded_mb:.1f} / {total_mb:.1f} MB", progress)
+
+        with open(filepath, 'wb') as f:
+            f.truncate(total_size)
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_THREADS) as executor:
+            futures = [executor.submit(download_range, start, end) for start, end in ranges]
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    # Don't start the remaining ranges of a download that already failed
+                    for pending in futures:
+                        pending.cancel()
+                    raise future.exception()
+
     def extract_ffmpeg(self, zip_path):
-        """Extract FFmpeg from downloaded zip file"""
-        extract_dir = self.ffmpeg_dir / "temp_extract"
-        extract_dir.mkdir(exist_ok=True)
-        
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            # Find the extracted FFmpeg folder (usually has version in name)
-            extracted_folders = [f for f in extract_dir.iterdir() if f.is_dir()]
-            if not extracted_folders:
-                raise Exception("No folders found in extracted archive")
-                
-            ffmpeg_source = extracted_folders[0]
-            
-            # Move bin folder to our installation directory
-            source_bin = ffmpeg_source / "bin"
-            target_bin = self.ffmpeg_dir / "bin"
-            
-            if source_bin.exists():
-                if target_bin.exists():
-                    shutil.rmtree(target_bin)
-                shutil.move(str(source_bin), str(target_bin))
-            else:
-                raise Exception("FFmpeg bin folder not found in archive")
-                
-        finally:
-            # Cleanup temp extraction directory
-            if extract_dir.exists():
-                shutil.rmtree(extract_dir)
+        """Extract FFmpeg's executables from downloaded zip file straight into the installation directory"""
+        target_bin = self.ffmpeg_dir / "bin"
+
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            # Only FFMPEG_INSTALLED_FILES from <version folder>/bin/ are installed (the folder name has
+            # the version in it); ffplay, docs, presets and dev files are never written
+            bin_entries = []
+            for info in zip_ref.infolist():
+                parts = info.filename.split('/')
+                if len(parts) == 3 and parts[1] == 'bin' and parts[2].lower() in FFMPEG_INSTALLED_FILES:
+                    info.filename = parts[2]
+                    bin_entries.append(info)
+
+            if not any(info.filename.lower() == 'ffmpeg.exe' for info in bin_entries):
+                raise Exception("ffmpeg.exe not found in archive")
+
+            # Replace any previous installation
+            if target_bin.exists():
+                shutil.rmtree(target_bin)
+            for info in bin_entries:
+                zip_ref.extract(info, target_bin)
                 
     def verify_ffmpeg_installation(self):
         """Verify that FFmpeg was installed correctly (background execution)"""
@@ -1622,31 +2370,12 @@ class WAVtoFLACConverter:
         
         if not ffmpeg_exe.exists():
             return False
-            
-        try:
-            startupinfo, creation_flags = self.get_subprocess_config()
-            
-            result = subprocess.run([str(ffmpeg_exe), '-version'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=10,
-                                  startupinfo=startupinfo, 
-                                  creationflags=creation_flags,
-                                  stdin=subprocess.DEVNULL)
-            if result.returncode == 0:
-                # Check for FLAC support
-                flac_test = subprocess.run([str(ffmpeg_exe), '-encoders'], 
-                                         capture_output=True, 
-                                         text=True, 
-                                         timeout=10,
-                                         startupinfo=startupinfo, 
-                                         creationflags=creation_flags,
-                                         stdin=subprocess.DEVNULL)
-                return 'flac' in flac_test.stdout.lower()
-        except Exception:
-            pass
-            
-        return False
+
+        # The new executable has to be probed again; the fresh result is then reused by
+        # check_prerequisites() once the installation completes
+        probe_ffmpeg.cache_clear()
+        ffmpeg_version, flac_supported = probe_ffmpeg(str(ffmpeg_exe))
+        return ffmpeg_version is not None and flac_supported
         
     def update_install_progress(self, message, progress):
         """Update installation progress (thread-safe)"""
@@ -1662,7 +2391,7 @@ class WAVtoFLACConverter:
         """Called when FFmpeg installation is completed successfully"""
         self.install_ffmpeg_btn.config(text="Reinstall FFmpeg")
         
-        # Re-check prerequisites
+        # Re-check prerequisites (verify_ffmpeg_installation() already probed the new executable)
         self.check_prerequisites()
         
         if hasattr(self, 'install_dialog'):
@@ -1672,23 +2401,14 @@ class WAVtoFLACConverter:
             
     def compare_versions(self, current, latest):
         """Compare version strings (with fallback if packaging not available)"""
-        if HAS_PACKAGING:
-            try:
-                return version.parse(latest) > version.parse(current)
-            except Exception:
-                pass
-        
+        try:
+            return parse_version(latest) > parse_version(current)
+        except Exception:
+            pass
+
         # Simple fallback version comparison
         try:
-            current_parts = [int(x) for x in current.split('.')]
-            latest_parts = [int(x) for x in latest.split('.')]
-            
-            # Pad shorter version with zeros
-            max_len = max(len(current_parts), len(latest_parts))
-            current_parts.extend([0] * (max_len - len(current_parts)))
-            latest_parts.extend([0] * (max_len - len(latest_parts)))
-            
-            return latest_parts > current_parts
+            return parse_version_parts(latest) > parse_version_parts(current)
         except Exception:
             return False
             
@@ -1698,6 +2418,11 @@ class WAVtoFLACConverter:
             # Update checking disabled
             self.update_status_var.set("")
             return
+
+        if time.time() < self.update_state.get('remind_after', 0):
+            # User chose "Remind Later" recently - don't even ask GitHub
+            self.update_status_var.set("")
+            return
             
         if not self.is_checking_updates:
             self.is_checking_updates = True
@@ -1734,7 +2459,10 @@ class WAVtoFLACConverter:
             tag_name = data.get('tag_name', '')
             latest_version = tag_name.lstrip('v')  # Remove 'v' prefix if present
 
-            if latest_version and self.compare_versions(APP_VERSION, latest_version):
+            if latest_version and latest_version == self.update_state.get('skipped_version'):
+                # User chose "Skip Version" for this release - stay quiet until the next one
+                self.root.after(0, lambda: self.update_status_var.set(""))
+            elif latest_version and self.compare_versions(APP_VERSION, latest_version):
                 self.latest_version = latest_version
                 self.update_available = True
 
@@ -1771,23 +2499,32 @@ class WAVtoFLACConverter:
             self.show_update_dialog()
             
     def show_update_dialog(self):
-        """Show dialog with update information"""
+        """Show dialog with update information (built once, then only the version text changes)"""
         if not self.latest_version:
             return
-            
-        # Create update dialog
-        update_dialog = tk.Toplevel(self.root)
-        update_dialog.title("Update Available")
-        update_dialog.geometry("400x300")
-        update_dialog.resizable(False, False)
-        update_dialog.grab_set()  # Make dialog modal
-        
-        # Center the dialog
-        update_dialog.transient(self.root)
-        update_dialog.geometry("+%d+%d" % (
+
+        if self.update_dialog is None or not self.update_dialog.winfo_exists():
+            self.build_update_dialog()
+
+        self.latest_version_var.set(f"Latest Version: v{self.latest_version}")
+
+        # Place the dialog; Tk sizes it to its content
+        self.update_dialog.geometry("+%d+%d" % (
             self.root.winfo_rootx() + 150,
             self.root.winfo_rooty() + 100
         ))
+        self.update_dialog.deiconify()
+        self.update_dialog.grab_set()  # Make dialog modal
+
+    def build_update_dialog(self):
+        """Create the update dialog's window and widgets (hidden until show_update_dialog())"""
+        update_dialog = tk.Toplevel(self.root)
+        update_dialog.withdraw()
+        update_dialog.transient(self.root)
+        update_dialog.title("Update Available")
+        update_dialog.resizable(False, False)
+        # Closing the window only hides it, like the buttons do
+        update_dialog.protocol("WM_DELETE_WINDOW", self.hide_update_dialog)
         
         # Dialog content
         main_frame = ttk.Frame(update_dialog, padding="20")
@@ -1796,12 +2533,11 @@ class WAVtoFLACConverter:
         # Title
         ttk.Label(main_frame, text="Update Available", font=('Arial', 14, 'bold')).pack(pady=(0, 10))
         
-        # Version info
+        # Version info (latest_version_var is set by show_update_dialog())
         current_text = f"Current Version: v{APP_VERSION}"
-        latest_text = f"Latest Version: v{self.latest_version}"
         
         ttk.Label(main_frame, text=current_text).pack(anchor='w')
-        ttk.Label(main_frame, text=latest_text, font=('Arial', 9, 'bold')).pack(anchor='w', pady=(0, 10))
+        ttk.Label(main_frame, textvariable=self.latest_version_var, font=('Arial', 9, 'bold')).pack(anchor='w', pady=(0, 10))
         
         # Description
         description = ("A new version of WAV2FLAC is available.\n\n"
@@ -1816,46 +2552,82 @@ class WAVtoFLACConverter:
         button_frame.pack(fill=tk.X)
         
         ttk.Button(button_frame, text="View Release", 
-                  command=lambda: self.open_release_page(update_dialog)).pack(side=tk.LEFT, padx=(0, 10))
+                  command=self.open_release_page).pack(side=tk.LEFT, padx=(0, 10))
         
         ttk.Button(button_frame, text="Remind Later", 
-                  command=lambda: self.remind_later(update_dialog)).pack(side=tk.LEFT, padx=(0, 10))
+                  command=self.remind_later).pack(side=tk.LEFT, padx=(0, 10))
         
         ttk.Button(button_frame, text="Skip Version", 
-                  command=lambda: self.skip_version(update_dialog)).pack(side=tk.LEFT)
+                  command=self.skip_version).pack(side=tk.LEFT)
+
+        self.update_dialog = update_dialog
+
+    def hide_update_dialog(self):
+        """Hide the update dialog so it can be shown again without rebuilding it"""
+        self.update_dialog.grab_release()
+        self.update_dialog.withdraw()
                   
-    def open_release_page(self, dialog):
+    def open_release_page(self):
         """Open the release page in default browser"""
         try:
+            # Only needed here, so it isn't imported at startup (it pulls in several other modules)
+            import webbrowser
+
             # Construct GitHub release URL
             release_url = f"https://github.com/lainalex/wav2flac/releases/tag/v{self.latest_version}"
             
             # Open in default browser
             webbrowser.open(release_url)
             
-            dialog.destroy()
+            self.hide_update_dialog()
         except Exception as e:
             messagebox.showerror("Error", f"Could not open release page: {e}")
             
-    def remind_later(self, dialog):
-        """Close dialog and remind later"""
-        dialog.destroy()
-        # Could implement persistence to remind on next startup
+    def remind_later(self):
+        """Close dialog and don't check for updates again for UPDATE_REMIND_LATER_SECONDS"""
+        self.hide_update_dialog()
+        self.save_update_state(remind_after=time.time() + UPDATE_REMIND_LATER_SECONDS)
         
-    def skip_version(self, dialog):
+    def skip_version(self):
         """Skip this version update"""
         self.update_available = False
         self.update_status_var.set("")
-        dialog.destroy()
-        # Could implement persistence to not show this version again
+        self.hide_update_dialog()
+        self.save_update_state(skipped_version=self.latest_version)
+
+    def load_update_state(self):
+        """Load the saved "Skip Version" / "Remind Later" choices (empty if none or unreadable)"""
+        try:
+            with open(self.update_state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def save_update_state(self, **changes):
+        """Update and save the "Skip Version" / "Remind Later" choices"""
+        self.update_state.update(changes)
+        try:
+            self.update_state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.update_state_file, 'w', encoding='utf-8') as f:
+                json.dump(self.update_state, f)
+        except OSError as e:
+            self.log_message(f"Could not save update preferences: {e}")
 
 def main():
     # Set up high DPI awareness for Windows
-    try:
-        from ctypes import windll
-        windll.shcore.SetProcessDpiAwareness(1)
-    except:
-        pass
+    if sys.platform == "win32":
+        # Per-monitor v2 (Windows 10 1703+) keeps text sharp when the window moves to another monitor;
+        # older Windows falls back to system-wide DPI awareness
+        try:
+            dpi_aware = ctypes.windll.user32.SetProcessDpiAwarenessContext(ctypes.c_void_p(-4))
+        except:
+            dpi_aware = False
+        if not dpi_aware:
+            try:
+                ctypes.windll.shcore.SetProcessDpiAwareness(1)
+            except:
+                pass
         
     try:
         root = tk.Tk()
@@ -1863,21 +2635,12 @@ def main():
         root.mainloop()
     except KeyboardInterrupt:
         print("\n\nApplication interrupted by user.")
-        # Try to log the interruption if possible
-        try:
-            logger = logging.getLogger(__name__)
-            logger.warning("Application interrupted by user (Ctrl+C)")
-        except:
-            pass
+        logger.warning("Application interrupted by user (Ctrl+C)")
     except Exception as e:
         print(f"\nUnexpected error: {e}")
-        # Try to log the error if possible
-        try:
-            logger = logging.getLogger(__name__)
-            logger.error(f"Unexpected application error: {e}", exc_info=True)
-        except:
-            pass
+        logger.error(f"Unexpected application error: {e}", exc_info=True)
         sys.exit(1)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Required for the conversion process pool in the frozen Windows executable
     main()
\ No newline at end of file